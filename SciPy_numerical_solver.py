@@ -1,6 +1,8 @@
 from scipy.integrate import solve_ivp
 import numpy as np
 
+from heat_equation import heat_rhs, solve_method_of_lines
+
 L = 1.0
 alpha = 0.01
 x_points = 100
@@ -11,9 +13,11 @@ dt = 0.01
 x = np.linspace(0, L, x_points)
 u0 = np.sin(np.pi * x)  # Initial condition
 
-def heat_eq(t, u):
-    dudt = np.zeros_like(u)
-    dudt[1:-1] = alpha * (u[:-2] - 2 * u[1:-1] + u[2:]) / dx**2
-    return dudt
+# Semi-discrete right-hand side, evaluated in a preallocated buffer
+heat_eq = heat_rhs(x_points, dx, alpha)
 
+# Non-stiff reference run
 sol = solve_ivp(heat_eq, [0, T], u0, method='RK45', t_eval=np.linspace(0, T, int(T / dt)))
+
+# Stiff run with the sparse tridiagonal Jacobian (also 'Radau' or 'LSODA')
+sol_stiff = solve_method_of_lines(u0, T, alpha, dx, method='BDF', t_eval=np.linspace(0, T, int(T / dt)))
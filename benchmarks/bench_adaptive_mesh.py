@@ -0,0 +1,104 @@
+"""
+Points needed by the adaptive mesh and a clustered grid versus a uniform grid for the sharp Gaussian peak.
+
+The initial profile is exp(-100 (x - L/2)**2), the peak of monte-carlo_method.py, on
+rods of increasing length L with zero Dirichlet ends. The exact solution is the
+diffusing Gaussian plus its images in both ends. For every tolerance of the adaptive
+solver the benchmark reports the largest and mean number of points used and the max
+error at t = T. The same is reported for fixed grids clustered at the center
+(clustered_grid, strength 4). Each run is compared with the uniform-grid size that
+reaches the same error, interpolated from a uniform sweep with the observed
+second-order rate.
+
+On L = 1 the diffusing peak soon covers most of the rod. The adaptive mesh then
+needs more points than a uniform grid (reduction below 1x), while the clustered
+grid needs about 1.4x fewer. The adaptive reduction grows with the share of the
+rod that stays flat.
+
+Run from the repository root:
+    python benchmarks/bench_adaptive_mesh.py [L ...]
+"""
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from heat_equation import GaussianProfile, clustered_grid, nonuniform_stepper, solve_adaptive_mesh
+
+ALPHA = 0.1
+T = 0.05
+T_POINTS = 201
+SHARPNESS = 100.0
+
+def exact_solution(x, t, L, n_images=3):
+    spread = 1 + 4 * SHARPNESS * ALPHA * t
+    center = L / 2
+    u = np.zeros_like(x)
+    for k in range(-n_images, n_images + 1):
+        u += np.exp(-SHARPNESS * (x - center - 2 * k * L)**2 / spread)
+        u -= np.exp(-SHARPNESS * (x + center - 2 * k * L)**2 / spread)
+    return u / np.sqrt(spread)
+
+def run_fixed(x, L):
+    u = GaussianProfile(L / 2, SHARPNESS)(x)
+    u[0] = u[-1] = 0.0
+    u_new = u.copy()
+    step = nonuniform_stepper(x, ALPHA, T / (T_POINTS - 1))
+    for _ in range(T_POINTS - 1):
+        step(u, u_new)
+        u, u_new = u_new, u
+    return np.max(np.abs(u - exact_solution(x, T, L)))
+
+def run_uniform(L, x_points):
+    return run_fixed(np.linspace(0, L, x_points), L)
+
+def run_clustered(L, x_points, strength=4.0):
+    return run_fixed(clustered_grid(L, x_points, L / 2, strength), L)
+
+def run_adaptive(L, tol):
+    solution = solve_adaptive_mesh(L, T, ALPHA, T_POINTS, GaussianProfile(L / 2, SHARPNESS), 0.0, 0.0, tol=tol,
+                                   n_initial=int(8 * L) + 1)
+    error = np.max(np.abs(solution.u[-1] - exact_solution(solution.x[-1], T, L)))
+    return solution.n_points, error
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start
+
+def uniform_points_for(error, sizes, errors):
+    """Uniform grid size reaching `error`, from a log-log fit of the uniform sweep."""
+    slope, intercept = np.polyfit(np.log(errors), np.log(np.asarray(sizes) - 1), 1)
+    return int(np.ceil(np.exp(intercept + slope * np.log(error)))) + 1
+
+def benchmark(L):
+    print(f"L = {L}")
+    sizes = [int(per_unit * L) + 1 for per_unit in (40, 80, 160, 320, 640)]
+    errors = []
+    print(f"  {'uniform points':>15} {'max error':>10} {'time [s]':>9}")
+    for x_points in sizes:
+        error, seconds = timed(run_uniform, L, x_points)
+        errors.append(error)
+        print(f"  {x_points:>15} {error:>10.2e} {seconds:>9.4f}")
+
+    print(f"  {'clustered points':>16} {'max error':>10} {'time [s]':>9} {'uniform needed':>14} {'reduction':>9}")
+    for x_points in sizes[:-1]:
+        error, seconds = timed(run_clustered, L, x_points)
+        needed = uniform_points_for(error, sizes, errors)
+        print(f"  {x_points:>16} {error:>10.2e} {seconds:>9.4f} {needed:>14} {needed / x_points:>8.1f}x")
+
+    print(f"  {'tol':>8} {'max points':>10} {'mean points':>11} {'max error':>10} {'time [s]':>9} "
+          f"{'uniform needed':>14} {'reduction':>9}")
+    for tol in (1e-3, 3e-4, 1e-4, 3e-5):
+        (n_points, error), seconds = timed(run_adaptive, L, tol)
+        needed = uniform_points_for(error, sizes, errors)
+        print(f"  {tol:>8.0e} {n_points.max():>10} {n_points.mean():>11.1f} {error:>10.2e} {seconds:>9.4f} "
+              f"{needed:>14} {needed / n_points.max():>8.1f}x")
+
+if __name__ == "__main__":
+    lengths = [float(arg) for arg in sys.argv[1:]] or [1.0, 4.0, 16.0]
+    for L in lengths:
+        benchmark(L)
@@ -0,0 +1,60 @@
+"""
+Strong-scaling benchmark of the domain-decomposed explicit solver.
+
+A fixed 1D and 2D problem is run with 1, 2, 4, ..., 32 worker processes (capped at
+the number of cores unless a larger count is given on the command line) and every
+result is compared with the serial run.
+
+Run from the repository root:
+    python benchmarks/bench_domain_decomposition.py [max_workers]
+"""
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from heat_equation import decomposed_ftcs
+
+def initial_1d(x_points):
+    x = np.linspace(0, 1.0, x_points)
+    u = np.sin(np.pi * x)
+    u[0] = u[-1] = 0
+    return u
+
+def initial_2d(x_points, y_points):
+    x = np.linspace(0, 1.0, x_points)[:, None]
+    y = np.linspace(0, 1.0, y_points)[None, :]
+    u = np.sin(np.pi * x) * np.sin(np.pi * y)
+    u[0, :] = u[-1, :] = 0
+    u[:, 0] = u[:, -1] = 0
+    return u
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - start, result
+
+if __name__ == "__main__":
+    max_workers = int(sys.argv[1]) if len(sys.argv) > 1 else min(32, os.cpu_count() or 1)
+    worker_counts = [w for w in (1, 2, 4, 8, 16, 32) if w <= max_workers]
+
+    # (label, initial state, r, n_steps)
+    cases = [
+        ("1D 4e6", initial_1d(4_000_000), 0.4, 200),
+        ("2D 2000^2", initial_2d(2000, 2000), (0.2, 0.2), 100),
+    ]
+
+    print(f"{'case':>10} {'workers':>8} {'time [s]':>9} {'speedup':>8} {'efficiency':>11} {'max |diff|':>11}")
+    for label, u_init, r, n_steps in cases:
+        t_serial, serial = timed(lambda: decomposed_ftcs(u_init, r, n_steps, n_workers=1))
+        for n_workers in worker_counts:
+            if n_workers == 1:
+                elapsed, result = t_serial, serial
+            else:
+                elapsed, result = timed(lambda: decomposed_ftcs(u_init, r, n_steps, n_workers=n_workers))
+            speedup = t_serial / elapsed
+            max_diff = np.max(np.abs(result - serial))
+            print(f"{label:>10} {n_workers:>8} {elapsed:>9.3f} {speedup:>7.2f}x {speedup / n_workers:>10.0%} {max_diff:>11.2e}")
@@ -0,0 +1,222 @@
+"""
+Accuracy-vs-cost benchmark of every solution method in the repository.
+
+Each method solves u_t = alpha u_xx on [0, 1] with u(x, 0) = sin(pi x) and zero
+Dirichlet ends, whose exact solution exp(-alpha pi^2 t) sin(pi x) is the one plotted
+by plot_3D_heat_equation.py. For a sweep of grid sizes and step counts (or the
+method's own resolution parameter) the harness records the best wall time over
+`--repeat` runs, the peak traced memory of one extra run, and the max error at t = T.
+
+Results are written as JSON (one record per method and configuration, plus machine
+metadata), by default to benchmarks/bench_methods.json; with --baseline, wall times
+and errors are compared against an earlier results file and regressions are flagged.
+
+Run from the repository root:
+    python benchmarks/bench_methods.py [--quick] [--output results.json] [--baseline old.json]
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+import numpy as np
+import scipy
+import sympy as sp
+from scipy.integrate import solve_ivp
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from heat_equation import (crank_nicolson_stepper, ftcs_march, green_solution, heat_rhs, implicit_stepper,
+                           laplace_heat_solution, random_walk_expectation, rk2_stepper, sine_coefficients,
+                           sine_series_solution, solve_method_of_lines, spectral_exact_solution)
+
+L, T, ALPHA = 1.0, 0.5, 0.1
+
+def exact_solution(x, t):
+    return np.exp(-ALPHA * np.pi**2 * t) * np.sin(np.pi * x)
+
+def initial_condition(x):
+    return np.sin(np.pi * x)
+
+def initial_state(x_points):
+    x = np.linspace(0, L, x_points)
+    u = initial_condition(x)
+    u[0] = u[-1] = 0.0
+    return x, u
+
+def march(step, u, n_steps):
+    u_new = u.copy()
+    for _ in range(n_steps):
+        step(u, u_new)
+        u, u_new = u_new, u
+    return u
+
+def mesh_ratio(x_points, t_points):
+    return ALPHA * (T / (t_points - 1)) / (L / (x_points - 1))**2
+
+# Every runner returns (x, u(x, T))
+
+def run_explicit(x_points, t_points):
+    x, u = initial_state(x_points)
+    return x, ftcs_march(u, mesh_ratio(x_points, t_points), t_points - 1)
+
+def run_implicit(x_points, t_points):
+    x, u = initial_state(x_points)
+    return x, march(implicit_stepper(mesh_ratio(x_points, t_points), x_points), u, t_points - 1)
+
+def run_crank_nicolson(x_points, t_points):
+    x, u = initial_state(x_points)
+    return x, march(crank_nicolson_stepper(mesh_ratio(x_points, t_points), x_points), u, t_points - 1)
+
+def run_rk2(x_points, t_points):
+    x, u = initial_state(x_points)
+    return x, march(rk2_stepper(mesh_ratio(x_points, t_points), x_points), u, t_points - 1)
+
+def run_spectral(x_points):
+    x, u = initial_state(x_points)
+    return x, spectral_exact_solution(u, ALPHA, x[1] - x[0], [T])[0]
+
+def run_solve_ivp(x_points, rtol):
+    x, u = initial_state(x_points)
+    sol = solve_ivp(heat_rhs(x_points, x[1] - x[0], ALPHA), (0, T), u, method='RK45', t_eval=[T],
+                    rtol=rtol, atol=rtol * 1e-3)
+    return x, sol.y[:, -1]
+
+def run_solve_ivp_bdf(x_points, rtol):
+    x, u = initial_state(x_points)
+    sol = solve_method_of_lines(u, T, ALPHA, x[1] - x[0], method='BDF', t_eval=[T], rtol=rtol, atol=rtol * 1e-3)
+    return x, sol.y[:, -1]
+
+def run_monte_carlo(x_points, n_particles):
+    # Symmetric +/-dx walks with dt = dx^2 / (2 alpha), absorbed at the ends
+    x = np.linspace(0, L, x_points)
+    dx = x[1] - x[0]
+    n_steps = int(round(2 * ALPHA * T / dx**2))
+    return x, random_walk_expectation(x, initial_condition, L, dx, n_steps, n_particles, seed=0)
+
+def run_fourier(x_points, n_modes):
+    b = sine_coefficients(initial_condition, L, n_modes)
+    return np.linspace(0, L, x_points), sine_series_solution(b, [T], x_points, L, ALPHA)[0]
+
+# The Green's function scripts use the free-space kernel, which does not see the
+# Dirichlet ends, so their error measures that modelling difference as well
+
+def run_green_matrix(x_points):
+    return np.linspace(0, L, x_points), green_solution(initial_condition, L, ALPHA, x_points, [T])[0]
+
+def run_green_fft(x_points):
+    return np.linspace(0, L, x_points), green_solution(initial_condition, L, ALPHA, x_points, [T], method='fft')[0]
+
+def run_laplace(x_points):
+    # Cold run: bypass both the in-process memo and the on-disk cache
+    x_sym = sp.Symbol('x')
+    _, u_numeric = laplace_heat_solution.__wrapped__(sp.sin(sp.pi * x_sym), ALPHA, cache=False)
+    x = np.linspace(0, L, x_points)
+    return x, u_numeric(x, T)
+
+def configurations(quick):
+    """(method, runner, parameters) for the sweep."""
+    x_sweep = (51, 101) if quick else (51, 101, 201, 401)
+    t_sweep = (101, 1001) if quick else (101, 1001, 10001)
+    configs = []
+    for method, runner in [('explicit', run_explicit), ('rk2', run_rk2),
+                           ('implicit', run_implicit), ('crank_nicolson', run_crank_nicolson)]:
+        for x_points in x_sweep:
+            for t_points in t_sweep:
+                if method in ('explicit', 'rk2') and mesh_ratio(x_points, t_points) > 0.5:
+                    continue  # unstable
+                configs.append((method, runner, {'x_points': x_points, 't_points': t_points}))
+    for x_points in x_sweep:
+        configs.append(('spectral', run_spectral, {'x_points': x_points}))
+        configs.append(('green_matrix', run_green_matrix, {'x_points': x_points}))
+        configs.append(('green_fft', run_green_fft, {'x_points': x_points}))
+        for rtol in (1e-4, 1e-7):
+            configs.append(('solve_ivp_rk45', run_solve_ivp, {'x_points': x_points, 'rtol': rtol}))
+            configs.append(('solve_ivp_bdf', run_solve_ivp_bdf, {'x_points': x_points, 'rtol': rtol}))
+        for n_modes in (4, 32):
+            configs.append(('fourier', run_fourier, {'x_points': x_points, 'n_modes': n_modes}))
+    for x_points in ((11, 21) if quick else (11, 21, 41)):
+        for n_particles in ((1000,) if quick else (1000, 10000)):
+            configs.append(('monte_carlo', run_monte_carlo, {'x_points': x_points, 'n_particles': n_particles}))
+    configs.append(('laplace', run_laplace, {'x_points': x_sweep[-1]}))
+    return configs
+
+def measure(runner, params, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        x, u = runner(**params)
+        times.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    runner(**params)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    error = float(np.max(np.abs(u - exact_solution(x, T))))
+    return min(times), peak, error
+
+def metadata():
+    return {
+        'timestamp': datetime.now(timezone.utc).isoformat(),
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'scipy': scipy.__version__,
+        'sympy': sp.__version__,
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'problem': {'L': L, 'T': T, 'alpha': ALPHA, 'u0': 'sin(pi x)'},
+    }
+
+def compare(records, baseline_path, time_tolerance):
+    """Print records that got slower than time_tolerance or less accurate than the baseline."""
+    with open(baseline_path) as handle:
+        baseline = {(r['method'], json.dumps(r['params'], sort_keys=True)): r for r in json.load(handle)['results']}
+
+    regressions = 0
+    for record in records:
+        old = baseline.get((record['method'], json.dumps(record['params'], sort_keys=True)))
+        if old is None:
+            continue
+        slower = record['seconds'] > old['seconds'] * (1 + time_tolerance)
+        worse = record['max_error'] > old['max_error'] * 1.01 + 1e-15
+        if slower or worse:
+            regressions += 1
+            print(f"REGRESSION {record['method']} {record['params']}: "
+                  f"{old['seconds']:.4g}s -> {record['seconds']:.4g}s, "
+                  f"error {old['max_error']:.3e} -> {record['max_error']:.3e}")
+    print(f"{regressions} regression(s) against {baseline_path}")
+    return regressions
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--quick', action='store_true', help="smaller sweep")
+    parser.add_argument('--repeat', type=int, default=3, help="timing repetitions (best is kept)")
+    parser.add_argument('--output', default=os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                                         'bench_methods.json'),
+                        help="JSON results file")
+    parser.add_argument('--baseline', help="earlier results file to compare against")
+    parser.add_argument('--time-tolerance', type=float, default=0.25,
+                        help="relative slowdown reported as a regression")
+    args = parser.parse_args()
+
+    records = []
+    print(f"{'method':>15} {'parameters':>40} {'time [s]':>10} {'peak [MB]':>10} {'max error':>10}")
+    for method, runner, params in configurations(args.quick):
+        repeat = 1 if method in ('laplace', 'monte_carlo') else args.repeat
+        seconds, peak, error = measure(runner, params, repeat)
+        records.append({'method': method, 'params': params, 'seconds': seconds,
+                        'peak_bytes': peak, 'max_error': error})
+        label = ', '.join(f"{key}={value}" for key, value in params.items())
+        print(f"{method:>15} {label:>40} {seconds:>10.4f} {peak / 2**20:>10.2f} {error:>10.2e}")
+
+    with open(args.output, 'w') as handle:
+        json.dump({'metadata': metadata(), 'results': records}, handle, indent=2)
+    print(f"Wrote {len(records)} results to {args.output}")
+
+    if args.baseline:
+        sys.exit(1 if compare(records, args.baseline, args.time_tolerance) else 0)
@@ -0,0 +1,58 @@
+"""
+Benchmark the vectorized FTCS engine against the original Python double loop.
+
+Run from the repository root:
+    python benchmarks/bench_stencil.py
+"""
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from heat_equation import ftcs_march
+
+def loop_ftcs(u, r):
+    """Reference implementation: the per-point update the solvers used before."""
+    t_points, x_points = u.shape
+    for n in range(0, t_points - 1):
+        for i in range(1, x_points - 1):
+            u[n + 1, i] = u[n, i] + r * (u[n, i - 1] - 2 * u[n, i] + u[n, i + 1])
+    return u
+
+def make_history(x_points, t_points):
+    x = np.linspace(0, 1.0, x_points)
+    u = np.zeros((t_points, x_points))
+    u[0, :] = np.sin(np.pi * x)
+    u[:, 0] = 0
+    u[:, -1] = 0
+    return u
+
+def best_of(fn, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+def run(x_points, t_points, r=0.4, repeat=3):
+    u_loop = make_history(x_points, t_points)
+    u_vec = make_history(x_points, t_points)
+
+    t_loop = best_of(lambda: loop_ftcs(u_loop, r), 1)
+    t_vec = best_of(lambda: ftcs_march(u_vec[0, :], r, t_points - 1, 0, 0, history=u_vec), repeat)
+
+    max_diff = np.max(np.abs(u_loop - u_vec))
+    return t_loop, t_vec, max_diff
+
+if __name__ == "__main__":
+    # (x_points, t_points); the last case is the energy-bounds example.
+    cases = [(1000, 2000), (5000, 500), (100, 50000)]
+
+    print(f"{'x_points':>9} {'t_points':>9} {'loop [s]':>10} {'numpy [s]':>10} {'speedup':>9} {'max |diff|':>11}")
+    for x_points, t_points in cases:
+        t_loop, t_vec, max_diff = run(x_points, t_points)
+        print(f"{x_points:>9} {t_points:>9} {t_loop:>10.3f} {t_vec:>10.4f} {t_loop / t_vec:>8.1f}x {max_diff:>11.2e}")
@@ -0,0 +1,84 @@
+import os
+import sys
+
+import numpy as np
+import matplotlib.pyplot as plt
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from heat_equation import GaussianProfile, clustered_grid, nonuniform_stepper, solve_adaptive_mesh
+
+def nonuniform_method_heat_equation(L, T, alpha, x_points, t_points, u0, u_left, u_right, center=None,
+                                    strength=4.0, method='crank_nicolson'):
+    """
+    Solve the 1D heat equation on a fixed grid clustered around a point.
+
+    Parameters:
+        center (float or None): Where the grid is finest; defaults to L / 2.
+        strength (float): Clustering strength, 0 for a uniform grid; see heat_equation.clustered_grid.
+        method (str): 'explicit', 'implicit' or 'crank_nicolson'.
+
+    Returns:
+        x, t, u: Grid points, time points and the solution of shape (t_points, x_points).
+    """
+    dt = T / (t_points - 1)
+    x = clustered_grid(L, x_points, L / 2 if center is None else center, strength)
+    t = np.linspace(0, T, t_points)
+    u = np.zeros((t_points, x_points))
+
+    u[0, :] = u0(x)
+    u[:, 0] = u_left
+    u[:, -1] = u_right
+
+    step = nonuniform_stepper(x, alpha, dt, method)
+    for n in range(0, t_points - 1):
+        step(u[n, :], u[n + 1, :])
+
+    return x, t, u
+
+def adaptive_mesh_heat_equation(L, T, alpha, t_points, u0, u_left, u_right, tol=1e-4, n_initial=21,
+                                adapt_every=5, method='crank_nicolson'):
+    """
+    Solve the 1D heat equation on a mesh that is refined and coarsened as the solution diffuses.
+
+    Fine cells follow the curvature of u, so a sharp initial peak is resolved where it
+    is and the rest of the rod keeps a coarse mesh; see heat_equation.solve_adaptive_mesh.
+    This saves points on long rods that stay mostly flat (L >= 4 for the peak below);
+    on L = 1 the clustered grid of nonuniform_method_heat_equation is cheaper.
+
+    Returns:
+        t (np.ndarray): Time points.
+        x (list of np.ndarray): Mesh of every time level.
+        u (list of np.ndarray): Solution on that mesh.
+    """
+    solution = solve_adaptive_mesh(L, T, alpha, t_points, u0, u_left, u_right, tol=tol, n_initial=n_initial,
+                                   adapt_every=adapt_every, method=method)
+    return solution.t, solution.x, solution.u
+
+
+L = 1.0
+T = 0.05
+alpha = 0.1
+x_points = 161
+t_points = 201
+u0 = GaussianProfile(L / 2, 100)  # The sharp peak of monte-carlo_method.py
+u_left, u_right = 0, 0
+
+# The peak soon spreads over most of the rod, so a fixed grid clustered at its center
+# beats both a uniform grid and the adaptive mesh here (see benchmarks/bench_adaptive_mesh.py)
+x, t, u = nonuniform_method_heat_equation(L, T, alpha, x_points, t_points, u0, u_left, u_right, strength=4.0)
+
+fig, (ax_profile, ax_spacing) = plt.subplots(1, 2, figsize=(12, 5))
+for n in (0, t_points // 4, t_points // 2, t_points - 1):
+    ax_profile.plot(x, u[n], '.-', markersize=3, label=f't = {t[n]:.3f}')
+ax_profile.set_title(f"Clustered Grid Solution ({x_points} points)")
+ax_profile.set_xlabel("Position (x)")
+ax_profile.set_ylabel("Temperature")
+ax_profile.legend()
+
+ax_spacing.plot(0.5 * (x[:-1] + x[1:]), np.diff(x))
+ax_spacing.set_title("Grid Spacing")
+ax_spacing.set_xlabel("Position (x)")
+ax_spacing.set_ylabel("dx")
+plt.tight_layout()
+plt.show()
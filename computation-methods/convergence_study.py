@@ -0,0 +1,54 @@
+import os
+import sys
+
+import numpy as np
+import matplotlib.pyplot as plt
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from heat_equation import FORMAL_ORDERS, ConvergenceStudy
+
+def sine_initial_condition(x):
+    return np.sin(np.pi * x)
+
+def grid_convergence_study(L, T, alpha, u0, u_left, u_right, method='crank_nicolson', x_points=6, t_points=11,
+                           n_levels=5, n_workers=1):
+    """
+    Run a solver on n_levels refined grids, print the observed orders and return the
+    Richardson-extrapolated solution; see heat_equation.ConvergenceStudy.
+
+    Returns:
+        ConvergenceResult: Differences between levels, observed orders and the extrapolated solution.
+    """
+    study = ConvergenceStudy(L, T, alpha, u0, u_left, u_right, method=method, x_points=x_points,
+                             t_points=t_points, n_workers=n_workers)
+    result = study.run(n_levels)
+
+    print(f"{method} (formal order {FORMAL_ORDERS[method]})")
+    print(f"{'x_points':>9} {'t_points':>9} {'max |u_l - u_(l-1)|':>20} {'order':>7}")
+    for level in range(1, n_levels):
+        order = f"{result.orders[level - 2]:7.3f}" if level >= 2 else " " * 7
+        print(f"{result.x_points[level]:>9} {result.t_points[level]:>9} {result.differences[level - 1]:>20.3e} {order}")
+    print(f"Estimated error of the finest level: {result.error_estimate:.3e}")
+    return result
+
+L, T, alpha = 1.0, 0.5, 0.1
+methods = ['explicit', 'implicit', 'crank_nicolson', 'rk2']
+
+plt.figure(figsize=(8, 6))
+for method in methods:
+    t_points = 21 if method in ('explicit', 'rk2') else 11
+    result = grid_convergence_study(L, T, alpha, sine_initial_condition, 0.0, 0.0, method=method, t_points=t_points)
+    dx = L / (np.asarray(result.x_points[1:]) - 1)
+    plt.loglog(dx, result.differences, 'o-', label=method)
+
+    X, T_grid = np.meshgrid(result.x, result.t)
+    exact = np.exp(-alpha * np.pi**2 * T_grid) * np.sin(np.pi * X)
+    print(f"Richardson-extrapolated max error: {np.max(np.abs(result.extrapolated - exact)):.3e}\n")
+
+plt.title("Grid Convergence of the Finite-Difference Solvers")
+plt.xlabel("dx")
+plt.ylabel("max |u_l - u_(l-1)|")
+plt.legend()
+plt.grid(True, which='both')
+plt.show()
@@ -1,7 +1,28 @@
+import os
+import sys
+
 import numpy as np
 import matplotlib.pyplot as plt
 
-def explicit_method_heat_equation(L, T, alpha, x_points, t_points, u0, u_left, u_right):
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from heat_equation import (decomposed_ftcs, ftcs_march, ftcs_stepper, is_constant_dirichlet, resolve_precision,
+                           save_stream, solve_heat_equation_bc, solve_variable_diffusivity, stream_states)
+
+def explicit_method_heat_equation(L, T, alpha, x_points, t_points, u0, u_left, u_right, backend='numpy',
+                                  dtype='float64'):
+    # 'float32' steps and stores in single precision, 'mixed' steps in float64 and stores float32;
+    # the variable-alpha and boundary-condition solvers step in float64 and take 'float64' or 'mixed'
+    compute_dtype, storage_dtype = resolve_precision(dtype)
+    if callable(alpha) or np.ndim(alpha) > 0:
+        # alpha(x) as nodal values or alpha(u): face-averaged flux form
+        return solve_variable_diffusivity(L, T, alpha, x_points, t_points, u0, u_left, u_right,
+                                          method='explicit', dtype=dtype)
+    if not (is_constant_dirichlet(u_left) and is_constant_dirichlet(u_right)):
+        # Neumann, Robin or time-dependent ends: operator built once, boundary data sampled up front
+        return solve_heat_equation_bc(L, T, alpha, x_points, t_points, u0, u_left, u_right,
+                                      method='explicit', dtype=dtype)
+
     dx = L / (x_points - 1)
     dt = T / (t_points - 1)
     r = alpha * dt / dx**2
@@ -11,18 +32,89 @@ def explicit_method_heat_equation(L, T, alpha, x_points, t_points, u0, u_left, u
 
     x = np.linspace(0, L, x_points)
     t = np.linspace(0, T, t_points)
-    u = np.zeros((t_points, x_points))
+    u = np.zeros((t_points, x_points), dtype=storage_dtype)
 
-    u[0, :] = u0(x)
+    u_init = np.empty(x_points, dtype=compute_dtype)
+    u_init[:] = u0(x)
+    u[0, :] = u_init
     u[:, 0] = u_left
     u[:, -1] = u_right
 
-    for n in range(0, t_points - 1):
-        for i in range(1, x_points - 1):
-            u[n + 1, i] = u[n, i] + r * (u[n, i - 1] - 2 * u[n, i] + u[n, i + 1])
+    ftcs_march(u_init, r, t_points - 1, u_left, u_right, history=u, backend=backend, dtype=compute_dtype)
 
     return x, t, u
 
+def explicit_method_heat_equation_stream(L, T, alpha, x_points, t_points, u0, u_left, u_right,
+                                         stride=1, times=None, reducers=()):
+    """
+    Streaming variant of explicit_method_heat_equation.
+
+    Holds only two time levels in memory and yields (t, u) snapshots every `stride`
+    steps or at the requested `times`; see heat_equation.stream_states.
+    """
+    dx = L / (x_points - 1)
+    dt = T / (t_points - 1)
+    r = alpha * dt / dx**2
+
+    if r > 0.5:
+        raise ValueError(f"Stability condition not met: r = {r} > 0.5")
+
+    x = np.linspace(0, L, x_points)
+    u_init = np.empty(x_points)
+    u_init[:] = u0(x)
+    u_init[0] = u_left
+    u_init[-1] = u_right
+
+    return stream_states(ftcs_stepper(r), u_init, dt, t_points - 1, stride, times, reducers)
+
+def explicit_method_heat_equation_store(L, T, alpha, x_points, t_points, u0, u_left, u_right, path, stride=1):
+    """
+    Run explicit_method_heat_equation_stream and archive every stride-th level on disk.
+
+    The space-time field goes row by row into a memory-mapped heat_equation.SolutionStore
+    at `path`, together with the run parameters, so the run never holds more than two
+    time levels in RAM and can be reloaded lazily for the bound analyses.
+
+    Returns:
+        SolutionStore: The finished store, opened for reading.
+    """
+    n_steps = t_points - 1
+    levels = list(range(0, n_steps + 1, stride))
+    if levels[-1] != n_steps:
+        levels.append(n_steps)
+
+    x = np.linspace(0, L, x_points)
+    t = np.asarray(levels) * (T / n_steps)
+    snapshots = explicit_method_heat_equation_stream(L, T, alpha, x_points, t_points, u0, u_left, u_right, stride)
+    return save_stream(path, snapshots, x, t, method='explicit', L=L, T=T, alpha=alpha, x_points=x_points,
+                       t_points=t_points, stride=stride, u_left=u_left, u_right=u_right)
+
+def explicit_method_heat_equation_parallel(L, T, alpha, x_points, t_points, u0, u_left, u_right, n_workers=None):
+    """
+    Domain-decomposed variant of explicit_method_heat_equation for very large grids.
+
+    The rod is split into slabs advanced by n_workers processes that share the field
+    through shared memory and exchange one-cell halos each step; see
+    heat_equation.decomposed_ftcs. Only the final state is returned.
+
+    Returns:
+        x, u: Spatial points and the solution at t = T.
+    """
+    dx = L / (x_points - 1)
+    dt = T / (t_points - 1)
+    r = alpha * dt / dx**2
+
+    if r > 0.5:
+        raise ValueError(f"Stability condition not met: r = {r} > 0.5")
+
+    x = np.linspace(0, L, x_points)
+    u_init = np.empty(x_points)
+    u_init[:] = u0(x)
+    u_init[0] = u_left
+    u_init[-1] = u_right
+
+    return x, decomposed_ftcs(u_init, r, t_points - 1, n_workers)
+
 L, T, alpha = 1.0, 0.5, 0.01
 x_points, t_points = 50, 500
 u0 = lambda x: np.sin(np.pi * x)
@@ -1,28 +1,84 @@
-def implicit_method_heat_equation(L, T, alpha, x_points, t_points, u0, u_left, u_right):
+import os
+import sys
+
+import numpy as np
+import matplotlib.pyplot as plt
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from heat_equation import (implicit_stepper, is_constant_dirichlet, march_history, resolve_precision,
+                           solve_heat_equation_bc, stream_states)
+
+def implicit_method_heat_equation(L, T, alpha, x_points, t_points, u0, u_left, u_right, solver='banded',
+                                  backend='numpy', dtype='float64'):
+    # 'float32' steps and stores in single precision, 'mixed' steps in float64 and stores float32;
+    # the variable-alpha and boundary-condition solvers step in float64 and take 'float64' or 'mixed'
+    compute_dtype, storage_dtype = resolve_precision(dtype)
+    if not (is_constant_dirichlet(u_left) and is_constant_dirichlet(u_right)):
+        # Neumann, Robin or time-dependent ends: operator built once, boundary data sampled up front
+        return solve_heat_equation_bc(L, T, alpha, x_points, t_points, u0, u_left, u_right,
+                                      method='implicit', dtype=dtype)
+
     dx = L / (x_points - 1)
     dt = T / (t_points - 1)
     r = alpha * dt / dx**2
 
     x = np.linspace(0, L, x_points)
     t = np.linspace(0, T, t_points)
-    u = np.zeros((t_points, x_points))
+    u = np.zeros((t_points, x_points), dtype=storage_dtype)
 
-    u[0, :] = u0(x)
+    u_init = np.empty(x_points, dtype=compute_dtype)
+    u_init[:] = u0(x)
+    u_init[0] = u_left
+    u_init[-1] = u_right
+    u[0, :] = u_init
     u[:, 0] = u_left
     u[:, -1] = u_right
 
+    if solver == 'banded':
+        # Factorize the constant tridiagonal matrix once, reuse it every step
+        step = implicit_stepper(r, x_points, backend, compute_dtype)
+        march_history(step, u_init, u)
+        return x, t, u
+    elif solver != 'dense':
+        raise ValueError(f"Unknown solver '{solver}', expected 'banded' or 'dense'")
+    if storage_dtype != np.float64:
+        raise ValueError(f"dtype '{dtype}' is not supported by the dense solver; use solver='banded'")
+
     A = np.zeros((x_points - 2, x_points - 2))
     np.fill_diagonal(A, 1 + 2 * r)
     np.fill_diagonal(A[:-1, 1:], -r)
     np.fill_diagonal(A[1:, :-1], -r)
 
     for n in range(0, t_points - 1):
-        b = u[n, 1:-1]
+        b = u[n, 1:-1].copy()
+        b[0] += r * u_left
+        b[-1] += r * u_right
         u_next = np.linalg.solve(A, b)
         u[n + 1, 1:-1] = u_next
 
     return x, t, u
 
+def implicit_method_heat_equation_stream(L, T, alpha, x_points, t_points, u0, u_left, u_right,
+                                         stride=1, times=None, reducers=()):
+    """
+    Streaming variant of implicit_method_heat_equation (banded solver).
+
+    Holds only two time levels in memory and yields (t, u) snapshots every `stride`
+    steps or at the requested `times`; see heat_equation.stream_states.
+    """
+    dx = L / (x_points - 1)
+    dt = T / (t_points - 1)
+    r = alpha * dt / dx**2
+
+    x = np.linspace(0, L, x_points)
+    u_init = np.empty(x_points)
+    u_init[:] = u0(x)
+    u_init[0] = u_left
+    u_init[-1] = u_right
+
+    return stream_states(implicit_stepper(r, x_points), u_init, dt, t_points - 1, stride, times, reducers)
+
 x, t, u = implicit_method_heat_equation(L, T, alpha, x_points, t_points, u0, u_left, u_right)
 
 plt.imshow(u, extent=[0, L, 0, T], origin='lower', aspect='auto', cmap='hot')
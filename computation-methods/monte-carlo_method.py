@@ -1,8 +1,16 @@
+import os
+import sys
+
 import numpy as np
 import matplotlib.pyplot as plt
 import plotly.graph_objects as go
 
-def monte_carlo_heat_equation(L, T, x_points, t_points, n_particles, n_steps):
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from heat_equation import GaussianProfile, parallel_random_walk_expectation, lattice_walk_density, resolve_precision
+
+def monte_carlo_heat_equation(L, T, x_points, t_points, n_particles, n_steps, seed=None, max_walkers=1_000_000,
+                              n_workers=1, return_stderr=False, backend='numpy', dtype='float64'):
     """
     Solve the heat equation using Monte Carlo simulations.
 
@@ -13,11 +21,21 @@ def monte_carlo_heat_equation(L, T, x_points, t_points, n_particles, n_steps):
         t_points (int): Number of time points.
         n_particles (int): Number of particles for the Monte Carlo simulation.
         n_steps (int): Number of steps per particle.
+        seed (int or None): Seed for the random number generator, for reproducible runs.
+        max_walkers (int): Maximum number of walkers held in memory at once (per worker).
+        n_workers (int or None): Number of worker processes; None uses all cores. For a
+            given seed the result does not depend on n_workers.
+        return_stderr (bool): Also return the standard error of every estimate.
+        backend (str): 'numpy', 'numba' or 'auto'; the compiled walker stops each particle
+            at its first boundary hit with a plain break. See heat_equation.jit.
+        dtype (str): Storage type of u and u_stderr: 'float64', or 'float32' / 'mixed'
+            (the walks themselves are always in float64).
         
     Returns:
         x (np.ndarray): Spatial points.
         t (np.ndarray): Time points.
         u (np.ndarray): Solution array u(x, t).
+        u_stderr (np.ndarray): Standard error of u, only if return_stderr is True.
     """
     # Discretize space and time
     x = np.linspace(0, L, x_points)
@@ -27,23 +45,23 @@ def monte_carlo_heat_equation(L, T, x_points, t_points, n_particles, n_steps):
     alpha = dx**2 / (2 * dt)  # Effective diffusivity
 
     # Initialize solution
-    u = np.zeros((t_points, x_points))
-
-    u[0, :] = np.exp(-100 * (x - L / 2)**2)  # Gaussian peak at the center
-
-    # Monte Carlo simulation for each time point
-    for n in range(1, t_points):
-        for i in range(x_points):
-            sum_temp = 0
-            for _ in range(n_particles):
-                pos = x[i]  # Start particle at position x[i]
-                for _ in range(n_steps):
-                    pos += np.random.choice([-dx, dx])  # Random walk step
-                    if pos <= 0 or pos >= L:  # Reflective boundary conditions
-                        break
-                sum_temp += np.exp(-100 * (pos - L / 2)**2)  # Contribution
-            u[n, i] = sum_temp / n_particles
+    _, storage_dtype = resolve_precision(dtype)
+    u = np.zeros((t_points, x_points), dtype=storage_dtype)
+
+    u_stderr = np.zeros((t_points, x_points), dtype=storage_dtype)
+
+    initial_profile = GaussianProfile(L / 2, 100)  # Gaussian peak at the center
+    u[0, :] = initial_profile(x)
+
+    # Monte Carlo simulation for every (time point, grid point) at once; walkers
+    # stop at the first boundary hit and contribute the profile at that position
+    x_start = np.broadcast_to(x, (t_points - 1, x_points))
+    u[1:, :], u_stderr[1:, :] = parallel_random_walk_expectation(x_start, initial_profile, L, dx, n_steps, n_particles,
+                                                                 boundary='absorbing', seed=seed, n_workers=n_workers,
+                                                                 max_walkers=max_walkers, backend=backend)
 
+    if return_stderr:
+        return x, t, u, u_stderr
     return x, t, u
 
 
@@ -54,7 +72,7 @@ t_points = 50    # Number of time points
 n_particles = 50  # Number of particles for Monte Carlo
 n_steps = 10    # Number of steps per particle
 
-x, t, u = monte_carlo_heat_equation(L, T, x_points, t_points, n_particles, n_steps)
+x, t, u = monte_carlo_heat_equation(L, T, x_points, t_points, n_particles, n_steps, seed=0)
 
 plt.figure(figsize=(8, 6))
 plt.imshow(u.T, extent=[0, T, 0, L], origin='lower', aspect='auto', cmap='hot')
@@ -74,7 +92,8 @@ plt.legend()
 plt.grid(True)
 plt.show()
 
-def monte_carlo_heat_eq_plotly(num_particles=1000, num_steps=100, domain_length=1.0, dt=0.01, dx=0.01, alpha=0.01):
+def monte_carlo_heat_eq_plotly(num_particles=1000, num_steps=100, domain_length=1.0, dt=0.01, dx=0.01, alpha=0.01, seed=None,
+                               n_workers=1):
     """
     Monte Carlo simulation for the heat equation with Plotly visualization.
     
@@ -85,34 +104,22 @@ def monte_carlo_heat_eq_plotly(num_particles=1000, num_steps=100, domain_length=
         dt (float): Time step size.
         dx (float): Spatial step size.
         alpha (float): Thermal diffusivity.
+        seed (int or None): Seed for the random number generator, for reproducible runs.
+        n_workers (int or None): Number of worker processes; None uses all cores.
     """
     # Discretize the spatial domain
     x_points = int(domain_length / dx) + 1
     x = np.linspace(0, domain_length, x_points)
     
-    # Particle positions, initialize uniformly in the domain
-    particle_positions = np.random.uniform(0, domain_length, size=num_particles)
-    
     # Precompute probabilities for random walk
     jump_prob = alpha * dt / dx**2  # Ensure this satisfies stability conditions
     if jump_prob > 0.5:
         raise ValueError("Jump probability too high! Reduce dt or increase dx for stability.")
     
-    # Array to store particle counts
-    particle_density = np.zeros((num_steps, x_points))
-    
-    # Monte Carlo simulation: track particle movements
-    for step in range(num_steps):
-        # Update particle positions using random walk
-        random_moves = np.random.choice([-1, 0, 1], size=num_particles, p=[jump_prob / 2, 1 - jump_prob, jump_prob / 2])
-        particle_positions += random_moves * dx
-        
-        # Reflective boundary conditions
-        particle_positions = np.clip(particle_positions, 0, domain_length)
-        
-        # Count particles in spatial bins
-        particle_counts, _ = np.histogram(particle_positions, bins=x_points, range=(0, domain_length))
-        particle_density[step, :] = particle_counts / num_particles
+    # Monte Carlo simulation: particles start uniformly in the domain, take lazy random
+    # walk steps, are clipped at the ends and are counted in spatial bins every step
+    particle_density, _ = lattice_walk_density(num_particles, num_steps, domain_length, dx, jump_prob, x_points,
+                                               seed=seed, n_workers=n_workers)
     
     # Create an animated Plotly heatmap
     frames = []
@@ -144,4 +151,4 @@ def monte_carlo_heat_eq_plotly(num_particles=1000, num_steps=100, domain_length=
     
     fig.show()
 
-monte_carlo_heat_eq_plotly(num_particles=1000, num_steps=100, domain_length=1.0, dt=0.001, dx=0.02, alpha=0.01)
+monte_carlo_heat_eq_plotly(num_particles=1000, num_steps=100, domain_length=1.0, dt=0.001, dx=0.02, alpha=0.01, seed=0)
@@ -1,7 +1,15 @@
+import os
+import sys
+
 import numpy as np
 import matplotlib.pyplot as plt
 
-def heat_equation_runge_kutta(L, T, alpha, nx, nt, u0, u_left, u_right):
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from heat_equation import (is_constant_dirichlet, march_history, resolve_precision, rk2_stepper, rkc_integrate,
+                           solve_heat_equation_bc, stream_states)
+
+def heat_equation_runge_kutta(L, T, alpha, nx, nt, u0, u_left, u_right, dtype='float64'):
     """
     Solve the 1D heat equation using Runge-Kutta (RK2) time integration.
 
@@ -12,14 +20,23 @@ def heat_equation_runge_kutta(L, T, alpha, nx, nt, u0, u_left, u_right):
         nx (int): Number of spatial grid points.
         nt (int): Number of time steps.
         u0 (callable): Initial condition function u(x, 0).
-        u_left (float): Boundary condition at x=0.
-        u_right (float): Boundary condition at x=L.
+        u_left (float, callable or BoundaryCondition): Boundary condition at x=0; a
+            function of t or a Neumann/Robin condition from heat_equation.boundary.
+        u_right (float, callable or BoundaryCondition): Boundary condition at x=L.
+        dtype (str): 'float64', 'float32', or 'mixed' to step in float64 and store the
+            history in float32; see heat_equation.precision. Boundary conditions other
+            than constant Dirichlet values are solved in float64 and accept 'mixed' only.
 
     Returns:
         x (np.ndarray): Spatial grid points.
         t (np.ndarray): Time points.
         u (np.ndarray): Solution array u(x, t).
     """
+    compute_dtype, storage_dtype = resolve_precision(dtype)
+    if not (is_constant_dirichlet(u_left) and is_constant_dirichlet(u_right)):
+        # Neumann, Robin or time-dependent ends: operator built once, boundary data sampled up front
+        return solve_heat_equation_bc(L, T, alpha, nx, nt, u0, u_left, u_right, method='rk2', dtype=dtype)
+
     # Discretize space and time
     dx = L / (nx - 1)
     dt = T / (nt - 1)
@@ -32,10 +49,13 @@ def heat_equation_runge_kutta(L, T, alpha, nx, nt, u0, u_left, u_right):
         raise ValueError(f"Stability condition not met: r = {r} > 0.5")
 
     # Initialize the solution matrix
-    u = np.zeros((nt, nx))
-    u[0, :] = u0(x)  
-    u[:, 0] = u_left  # Boundary condition at x=0
-    u[:, -1] = u_right  # Boundary condition at x=L
+    u = np.zeros((nt, nx), dtype=storage_dtype)
+    u_init = np.empty(nx, dtype=compute_dtype)
+    u_init[:] = u0(x)
+    u_init[0] = u_left  # Boundary condition at x=0
+    u_init[-1] = u_right  # Boundary condition at x=L
+    u[:, 0] = u_left
+    u[:, -1] = u_right
 
     # Helper function for the spatial derivative
     def laplacian(u):
@@ -43,14 +63,87 @@ def heat_equation_runge_kutta(L, T, alpha, nx, nt, u0, u_left, u_right):
         dudx2[1:-1] = (u[:-2] - 2 * u[1:-1] + u[2:]) / dx**2
         return alpha * dudx2
 
-    # Runge-Kutta time stepping
-    for n in range(nt - 1):
-        k1 = dt * laplacian(u[n, :])
-        k2 = dt * laplacian(u[n, :] + 0.5 * k1)
-        u[n + 1, :] = u[n, :] + k2
+    # Runge-Kutta time stepping, in the compute dtype
+    def step(u, u_new):
+        k1 = dt * laplacian(u)
+        k2 = dt * laplacian(u + 0.5 * k1)
+        u_new[:] = u + k2
+
+    march_history(step, u_init, u)
 
     return x, t, u
 
+def heat_equation_runge_kutta_stream(L, T, alpha, nx, nt, u0, u_left, u_right,
+                                     stride=1, times=None, reducers=()):
+    """
+    Streaming variant of heat_equation_runge_kutta.
+
+    Holds only two time levels in memory and yields (t, u) snapshots every `stride`
+    steps or at the requested `times`; see heat_equation.stream_states.
+    """
+    dx = L / (nx - 1)
+    dt = T / (nt - 1)
+    x = np.linspace(0, L, nx)
+
+    r = alpha * dt / dx**2
+    if r > 0.5:
+        raise ValueError(f"Stability condition not met: r = {r} > 0.5")
+
+    u_init = np.empty(nx)
+    u_init[:] = u0(x)
+    u_init[0] = u_left
+    u_init[-1] = u_right
+
+    return stream_states(rk2_stepper(r, nx), u_init, dt, nt - 1, stride, times, reducers)
+
+def heat_equation_runge_kutta_adaptive(L, T, alpha, nx, u0, u_left, u_right, nt=100, rtol=1e-4, atol=1e-6):
+    """
+    Solve the 1D heat equation with adaptive Runge-Kutta-Chebyshev (RKC) time stepping.
+
+    Unlike the fixed RK2 step there is no r <= 0.5 restriction: the number of stages
+    grows with the step size to keep the method stable, and the step size follows
+    the local error estimate, so steps become large once the solution has smoothed.
+
+    Parameters:
+        L (float): Length of the rod.
+        T (float): Total time.
+        alpha (float): Thermal diffusivity.
+        nx (int): Number of spatial grid points.
+        u0 (callable): Initial condition function u(x, 0).
+        u_left (float): Boundary condition at x=0.
+        u_right (float): Boundary condition at x=L.
+        nt (int): Number of output times.
+        rtol (float): Relative tolerance of the local error.
+        atol (float): Absolute tolerance of the local error.
+
+    Returns:
+        x (np.ndarray): Spatial grid points.
+        t (np.ndarray): Output times.
+        u (np.ndarray): Solution array u(x, t).
+        stats (dict): Accepted/rejected step counts, right-hand side evaluations,
+            step sizes and stages per step (see heat_equation.rkc_integrate).
+    """
+    dx = L / (nx - 1)
+    x = np.linspace(0, L, nx)
+    t = np.linspace(0, T, nt)
+
+    u_init = np.empty(nx)
+    u_init[:] = u0(x)
+    u_init[0] = u_left
+    u_init[-1] = u_right
+
+    # Semi-discrete right-hand side, written into the solver's buffer
+    def laplacian(u, out):
+        out[0] = out[-1] = 0.0
+        interior = out[1:-1]
+        np.add(u[:-2], u[2:], out=interior)
+        interior -= 2 * u[1:-1]
+        interior *= alpha / dx**2
+        return out
+
+    t, u, stats = rkc_integrate(laplacian, u_init, T, 4 * alpha / dx**2, rtol=rtol, atol=atol, t_eval=t)
+    return x, t, u, stats
+
 L = 1.0  # Length of the rod
 T = 1.0  # Total time
 alpha = 0.01  # Thermal diffusivity
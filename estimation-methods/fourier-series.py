@@ -1,8 +1,15 @@
+import os
+import sys
+
 import numpy as np
 import matplotlib.pyplot as plt
 from scipy.integrate import quad
 
-def heat_equation_solution(f, L=1.0, alpha=0.01, N=50, x_points=100, t_points=100, T=1.0) -> None:
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from heat_equation import sine_coefficients, sine_series_solution
+
+def heat_equation_solution(f, L=1.0, alpha=0.01, N=50, x_points=100, t_points=100, T=1.0, method='dst'):
     """
     Solve the 1D heat equation using Fourier series with a user-defined initial condition.
 
@@ -14,31 +21,40 @@ def heat_equation_solution(f, L=1.0, alpha=0.01, N=50, x_points=100, t_points=10
         x_points (int): Number of spatial points.
         t_points (int): Number of time points.
         T (float): Total time.
+        method (str): 'dst' computes all b_n with one discrete sine transform,
+            'quad' integrates each b_n separately with scipy's quad.
+
+    Returns:
+        x (np.ndarray): Spatial points.
+        t (np.ndarray): Time points.
+        u (np.ndarray): Solution u(x, t) of shape (t_points, x_points).
     """
     x = np.linspace(0, L, x_points)
     t = np.linspace(0, T, t_points)
 
     # Compute Fourier coefficients b_n
-    def compute_bn(n):
-        # Integral of f(x) * sin(n*pi*x/L) over [0, L]
-        integrand = lambda x: f(x) * np.sin(n * np.pi * x / L)
-        bn, error_estimate = quad(integrand, 0, L)  # Integrate using scipy's quad
-        return (2 / L) * bn
-
-    b = [compute_bn(n) for n in range(1, N + 1)]
-
-    # Compute the solution u(x, t)
-    def u_xt(x, t):
-        solution = np.zeros_like(x)
-        for n in range(1, N + 1):
-            term = b[n - 1] * np.sin(n * np.pi * x / L) * np.exp(-alpha * (n * np.pi / L)**2 * t)
-            solution += term
-        return solution
+    if method == 'dst':
+        b = sine_coefficients(f, L, N)
+    elif method == 'quad':
+        def compute_bn(n):
+            # Integral of f(x) * sin(n*pi*x/L) over [0, L]
+            integrand = lambda x: f(x) * np.sin(n * np.pi * x / L)
+            bn, error_estimate = quad(integrand, 0, L)  # Integrate using scipy's quad
+            return (2 / L) * bn
+
+        b = np.array([compute_bn(n) for n in range(1, N + 1)])
+    else:
+        raise ValueError(f"Unknown method '{method}', expected 'dst' or 'quad'")
+
+    # Compute the solution u(x, t) on the whole grid: (decay * b) @ sine basis
+    u = sine_series_solution(b, t, x_points, L, alpha)
+
+    plot_times = np.linspace(0, T, 5)  # Plot for 5 time steps
+    u_plot = sine_series_solution(b, plot_times, x_points, L, alpha)
 
     plt.figure(figsize=(8, 6))
-    for time in np.linspace(0, T, 5):  # Plot for 5 time steps
-        u = u_xt(x, time)
-        plt.plot(x, u, label=f"t = {time:.2f}")
+    for time, u_time in zip(plot_times, u_plot):
+        plt.plot(x, u_time, label=f"t = {time:.2f}")
 
     plt.title("Heat Equation Solution via Fourier Series")
     plt.xlabel("x")
@@ -47,6 +63,8 @@ def heat_equation_solution(f, L=1.0, alpha=0.01, N=50, x_points=100, t_points=10
     plt.grid(True)
     plt.show()
 
+    return x, t, u
+
 
 # Examples with different initial conditions
 
@@ -1,8 +1,15 @@
+import os
+import sys
+
 import numpy as np
 import matplotlib.pyplot as plt
 from scipy.integrate import quad
 
-def heat_equation_green(f, L=1.0, alpha=0.01, x_points=100, t_points=100, T=1.0)->None:
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from heat_equation import green_solution
+
+def heat_equation_green(f, L=1.0, alpha=0.01, x_points=100, t_points=100, T=1.0, method='matrix'):
     """
     Solve the 1D heat equation using the Green's function method with a user-defined initial condition.
 
@@ -13,6 +20,14 @@ def heat_equation_green(f, L=1.0, alpha=0.01, x_points=100, t_points=100, T=1.0)
         x_points (int): Number of spatial points.
         t_points (int): Number of time points.
         T (float): Total time.
+        method (str): 'matrix' (cached kernel matrix times f at quadrature nodes),
+            'fft' (cached kernel, FFT convolution on a uniform grid) or 'quad'
+            (one adaptive integral per point and time).
+
+    Returns:
+        x (np.ndarray): Spatial points.
+        t (np.ndarray): Time points.
+        u (np.ndarray): Solution u(x, t) of shape (t_points, x_points).
     """
     x = np.linspace(0, L, x_points) 
     t = np.linspace(0, T, t_points) 
@@ -24,18 +39,23 @@ def heat_equation_green(f, L=1.0, alpha=0.01, x_points=100, t_points=100, T=1.0)
         return np.sqrt(1 / (4 * np.pi * alpha * t)) * np.exp(-((x - xi)**2) / (4 * alpha * t))
 
     # Compute the solution u(x, t) using Green's function
-    def u_xt(x, t):
-        solution = np.zeros_like(x)
-        for i, xi in enumerate(x):  # Evaluate integral for each point in x
-            integrand = lambda x_prime: f(x_prime) * G(xi, x_prime, t)
-            integral, _ = quad(integrand, 0, L)  # Integrate over the domain [0, L]
-            solution[i] = integral
+    def u_xt(times):
+        if method != 'quad':
+            return green_solution(f, L, alpha, x_points, times, method=method)
+        solution = np.zeros((len(times), x_points))
+        for k, time in enumerate(times):
+            for i, xi in enumerate(x):  # Evaluate integral for each point in x
+                integrand = lambda x_prime: f(x_prime) * G(xi, x_prime, time)
+                integral, _ = quad(integrand, 0, L)  # Integrate over the domain [0, L]
+                solution[k, i] = integral
         return solution
 
+    u = u_xt(t)
+
+    plot_times = np.linspace(0, T, 5)
     plt.figure(figsize=(8, 6))
-    for time in np.linspace(0, T, 5):  
-        u = u_xt(x, time)
-        plt.plot(x, u, label=f"t = {time:.2f}")
+    for time, u_time in zip(plot_times, u_xt(plot_times)):
+        plt.plot(x, u_time, label=f"t = {time:.2f}")
 
     plt.title("Heat Equation Solution via Green's Function")
     plt.xlabel("x")
@@ -44,6 +64,8 @@ def heat_equation_green(f, L=1.0, alpha=0.01, x_points=100, t_points=100, T=1.0)
     plt.grid(True)
     plt.show()
 
+    return x, t, u
+
 
 # Examples with different initial conditions
 
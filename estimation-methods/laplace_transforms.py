@@ -1,6 +1,13 @@
+import os
+import sys
+
 import numpy as np
 import matplotlib.pyplot as plt
-from sympy import symbols, laplace_transform, inverse_laplace_transform, sin, pi, exp, Function
+from sympy import symbols, laplace_transform, sin, pi, exp, Function
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from heat_equation import laplace_heat_solution
 
 def solve_heat_equation_laplace(f, L=1.0, alpha=0.01, x_points=100, t_points=100, T=1.0):
     """
@@ -20,18 +27,15 @@ def solve_heat_equation_laplace(f, L=1.0, alpha=0.01, x_points=100, t_points=100
     u_init = f(x)
 
     # Laplace-transformed equation: sU(x, s) - f(x) = alpha * d^2U(x, s)/dx^2
-    U_general = u_init / (s + (pi ** 2 * alpha))  # Derived analytical solution for U(x, s)
-
-    # Perform the inverse Laplace transform to get u(x, t)
-    u_solution = inverse_laplace_transform(U_general, s, t)
+    # U(x, s) = u_init / (s + pi^2 alpha); its inverse transform is compiled to a
+    # NumPy function once per (u_init, alpha) and reused on later calls
+    u_solution, u_xt = laplace_heat_solution(u_init, alpha)
 
     x_vals = np.linspace(0, L, x_points)
     t_vals = np.linspace(0, T, t_points)
 
-    u_numeric = np.zeros((t_points, x_points))
-    for i, t_val in enumerate(t_vals):
-        for j, x_val in enumerate(x_vals):
-            u_numeric[i, j] = u_solution.subs({x: x_val, t: t_val}).evalf()
+    X, T_grid = np.meshgrid(x_vals, t_vals)
+    u_numeric = u_xt(X, T_grid)
 
     plt.figure(figsize=(8, 6))
     for i in range(0, t_points, max(1, t_points // 5)):
@@ -0,0 +1,36 @@
+"""
+Shared numerical kernels for the heat equation scripts in this repository.
+
+The scripts in computation-methods/, estimation-methods/ and solution-bounds/ keep
+their original entry points and call into this package for the heavy lifting.
+"""
+
+from .stencil import ftcs_step, ftcs_march, ftcs_stepper, rk2_stepper
+from .banded import TridiagonalSolver, three_point_stencil, implicit_stepper, crank_nicolson_stepper
+from .streaming import Reducer, Energy, Maximum, Minimum, Probe, stream_states
+from .parallel import run_tasks
+from .monte_carlo import GaussianProfile, random_walk_expectation, parallel_random_walk_expectation, lattice_walk_density
+from .fourier import sine_coefficients, sine_basis, sine_series_solution
+from .green import heat_kernel, green_matrix, green_stencil, green_solution, clear_kernel_cache
+from .symbolic import laplace_heat_solution
+from .disk_cache import SymbolicDiskCache, default_cache, cached_simplify
+from .verification import numeric_screen, verify_candidates
+from .batched import BatchResult, solve_heat_equation_batch
+from .adaptive import rkc_integrate
+from .method_of_lines import laplacian_matrix, heat_rhs, solve_method_of_lines
+from .spectral import discrete_laplacian_eigenvalues, spectral_exact_solution, spectral_stepper
+from .multidim import (second_differences, ftcs_step_nd, ftcs_stepper_nd, laplacian_kron, implicit_stepper_nd,
+                       crank_nicolson_stepper_nd, solve_heat_equation_nd)
+from .domain_decomposition import slab_bounds, decomposed_ftcs
+from .jit import BACKENDS, NUMBA_AVAILABLE, resolve_backend
+from .store import SolutionStore, iter_row_chunks, save_stream
+from .monitors import Violation, BoundMonitor, MaximumPrincipleMonitor, EnergyMonitor, CauchySchwarzMonitor
+from .convergence import FORMAL_ORDERS, ConvergenceResult, ConvergenceStudy, time_refinement
+from .boundary import (BoundaryCondition, Dirichlet, Neumann, Robin, as_boundary_condition, is_constant_dirichlet,
+                       boundary_operator, solve_heat_equation_bc)
+from .variable import (face_diffusivity, variable_ftcs_stepper, variable_crank_nicolson_stepper,
+                       solve_variable_diffusivity)
+from .mesh import (clustered_grid, nonuniform_laplacian, nonuniform_stepper, mesh_indicator, equidistributed_mesh,
+                   adapt_mesh, transfer_solution, AdaptiveMeshSolution, solve_adaptive_mesh)
+from .precision import (PRECISIONS, resolve_precision, march_history, PrecisionReport, precision_report,
+                        compare_precision)
@@ -0,0 +1,150 @@
+import numpy as np
+
+def _rkc_coefficients(s, damping=2 / 13):
+    """
+    Coefficients of the damped second-order Runge-Kutta-Chebyshev method with s stages.
+
+    Returns arrays mu, nu, mu_tilde, gamma_tilde indexed by stage j (entries below
+    the first used index are unused), following Sommeijer, Shampine and Verwer (1997).
+    """
+    w0 = 1 + damping / s**2
+    T = np.zeros(s + 1)
+    dT = np.zeros(s + 1)
+    d2T = np.zeros(s + 1)
+    T[0], T[1] = 1.0, w0
+    dT[1] = 1.0
+    for j in range(2, s + 1):
+        T[j] = 2 * w0 * T[j - 1] - T[j - 2]
+        dT[j] = 2 * T[j - 1] + 2 * w0 * dT[j - 1] - dT[j - 2]
+        d2T[j] = 4 * dT[j - 1] + 2 * w0 * d2T[j - 1] - d2T[j - 2]
+    w1 = dT[s] / d2T[s]
+
+    b = np.zeros(s + 1)
+    b[2:] = d2T[2:] / dT[2:]**2
+    b[0] = b[1] = b[2]
+
+    mu = np.zeros(s + 1)
+    nu = np.zeros(s + 1)
+    mu_tilde = np.zeros(s + 1)
+    gamma_tilde = np.zeros(s + 1)
+    mu_tilde[1] = b[1] * w1
+    for j in range(2, s + 1):
+        mu[j] = 2 * b[j] * w0 / b[j - 1]
+        nu[j] = -b[j] / b[j - 2]
+        mu_tilde[j] = 2 * b[j] * w1 / b[j - 1]
+        gamma_tilde[j] = -(1 - b[j - 1] * T[j - 1]) * mu_tilde[j]
+    return mu, nu, mu_tilde, gamma_tilde
+
+def rkc_integrate(rhs, u_init, T, spectral_radius, rtol=1e-4, atol=1e-6, t_eval=None,
+                  dt_init=None, max_steps=100_000):
+    """
+    Integrate du/dt = rhs(u) on [0, T] with an adaptive Runge-Kutta-Chebyshev (RKC) method.
+
+    RKC is an explicit, second-order, stabilized method for parabolic problems: with s
+    stages its stability interval grows like 0.65 s^2, so the number of stages is
+    chosen from spectral_radius * dt and the step size is limited by accuracy only. The
+    local error is estimated from the embedded formula of Sommeijer, Shampine and
+    Verwer (1997) and controlled in the RMS norm with weights atol + rtol * |u|.
+
+    Parameters:
+        rhs (callable): rhs(u, out) writing du/dt into out.
+        u_init (np.ndarray): Initial state.
+        T (float): Final time.
+        spectral_radius (float): Upper bound on the spectral radius of the Jacobian of
+            rhs (4 alpha / dx**2 for the 1D heat equation).
+        rtol, atol (float): Relative and absolute tolerances.
+        t_eval (np.ndarray or None): Output times in [0, T]; steps are shortened to hit
+            them exactly. Defaults to [0, T].
+        dt_init (float or None): First trial step; defaults to 1 / spectral_radius.
+        max_steps (int): Maximum number of attempted steps.
+
+    Returns:
+        t (np.ndarray): Output times.
+        u (np.ndarray): States at the output times, shape (len(t),) + u_init.shape.
+        stats (dict): 'n_steps' (accepted), 'n_rejected', 'n_rhs' (rhs evaluations),
+            'dt' (accepted step sizes) and 'stages' (stages used per accepted step).
+    """
+    t_eval = np.array([0.0, T]) if t_eval is None else np.asarray(t_eval, dtype=float)
+    u = np.array(u_init, dtype=float)
+    out = np.empty((t_eval.size,) + u.shape)
+
+    F0 = np.empty_like(u)
+    F1 = np.empty_like(u)
+    Fj = np.empty_like(u)
+    y_prev = np.empty_like(u)
+    y_prev2 = np.empty_like(u)
+    y_new = np.empty_like(u)
+    err = np.empty_like(u)
+
+    stats = {'n_steps': 0, 'n_rejected': 0, 'n_rhs': 0, 'dt': [], 'stages': []}
+    coefficients = {}
+
+    t = 0.0
+    dt = dt_init if dt_init is not None else min(T, 1.0 / spectral_radius)
+    rhs(u, F0)
+    stats['n_rhs'] += 1
+
+    k = 0
+    while k < t_eval.size and t_eval[k] <= t:
+        out[k] = u
+        k += 1
+
+    attempts = 0
+    while k < t_eval.size:
+        if attempts >= max_steps:
+            raise RuntimeError(f"RKC did not reach t = {T} within {max_steps} steps")
+        attempts += 1
+
+        dt = min(dt, t_eval[k] - t)
+        s = max(2, 1 + int(np.sqrt(1 + 1.54 * dt * spectral_radius)))
+        if s not in coefficients:
+            coefficients[s] = _rkc_coefficients(s)
+        mu, nu, mu_tilde, gamma_tilde = coefficients[s]
+
+        # Y_1 = U_n + mu~_1 dt F(U_n)
+        y_prev2[...] = u
+        np.multiply(F0, mu_tilde[1] * dt, out=y_prev)
+        y_prev += u
+        for j in range(2, s + 1):
+            rhs(y_prev, Fj)
+            stats['n_rhs'] += 1
+            # Y_j = (1 - mu_j - nu_j) U_n + mu_j Y_{j-1} + nu_j Y_{j-2} + mu~_j dt F(Y_{j-1}) + gamma~_j dt F(U_n)
+            np.multiply(u, 1 - mu[j] - nu[j], out=y_new)
+            y_new += mu[j] * y_prev
+            y_new += nu[j] * y_prev2
+            y_new += (mu_tilde[j] * dt) * Fj
+            y_new += (gamma_tilde[j] * dt) * F0
+            y_prev2, y_prev, y_new = y_prev, y_new, y_prev2
+
+        # Embedded error estimate: (12 (U_n - U_n+1) + 6 dt (F(U_n) + F(U_n+1))) / 15
+        rhs(y_prev, F1)
+        stats['n_rhs'] += 1
+        np.subtract(u, y_prev, out=err)
+        err *= 12
+        err += (6 * dt) * (F0 + F1)
+        err /= 15
+        scale = atol + rtol * np.maximum(np.abs(u), np.abs(y_prev))
+        error = np.sqrt(np.mean((err / scale)**2))
+
+        factor = 10.0 if error == 0 else min(10.0, max(0.1, 0.8 * error**(-1 / 3)))
+        if error > 1.0:
+            stats['n_rejected'] += 1
+            dt *= factor
+            continue
+
+        t += dt
+        u, y_prev = y_prev, u
+        F0, F1 = F1, F0
+        stats['n_steps'] += 1
+        stats['dt'].append(dt)
+        stats['stages'].append(s)
+
+        if np.isclose(t, t_eval[k], rtol=1e-12, atol=1e-14 * max(1.0, T)):
+            t = t_eval[k]
+            out[k] = u
+            k += 1
+        dt *= factor
+
+    stats['dt'] = np.asarray(stats['dt'])
+    stats['stages'] = np.asarray(stats['stages'])
+    return t_eval, out, stats
@@ -0,0 +1,200 @@
+import numpy as np
+from scipy.linalg import lapack
+
+from .jit import resolve_backend, thomas_factorize, thomas_solve_kernel
+
+class TridiagonalSolver:
+    """
+    LU factorization of a constant tridiagonal matrix, computed once and reused.
+
+    The factorization is done by LAPACK's gttrf and every solve by gttrs, so each
+    time step costs O(N) work and O(N) memory instead of a dense O(N^3) solve.
+
+    Parameters:
+        lower (float or np.ndarray): Sub-diagonal, scalar or length n - 1.
+        diag (float or np.ndarray): Main diagonal, scalar or length n.
+        upper (float or np.ndarray): Super-diagonal, scalar or length n - 1.
+        n (int): Size of the system. Required when diag is a scalar.
+        dtype (np.dtype): float64 (dgttrf/dgttrs) or float32 (sgttrf/sgttrs); the
+            right-hand sides passed to solve should have the same type.
+    """
+
+    def __init__(self, lower, diag, upper, n=None, dtype=float):
+        if n is None:
+            n = len(diag)
+        self.n = n
+        self.dtype = np.dtype(dtype)
+        self._dl = np.empty(n - 1, dtype=self.dtype)
+        self._d = np.empty(n, dtype=self.dtype)
+        self._du = np.empty(n - 1, dtype=self.dtype)
+        self._gttrf, self._gttrs = lapack.get_lapack_funcs(('gttrf', 'gttrs'), dtype=self.dtype)
+        self.refactor(lower, diag, upper)
+
+    def refactor(self, lower, diag, upper):
+        """
+        Replace the matrix by another of the same size and factorize it in place.
+
+        The coefficients are copied into the solver's own buffers, which gttrf then
+        overwrites with the factors, so a nonlinear problem can refresh its operator
+        every step or iteration without allocating a new solver.
+
+        Parameters:
+            lower, diag, upper (float or np.ndarray): New diagonals, as in the constructor.
+        """
+        self._dl[:] = lower
+        self._d[:] = diag
+        self._du[:] = upper
+        self._dl, self._d, self._du, self._du2, self._ipiv, info = self._gttrf(
+            self._dl, self._d, self._du, overwrite_dl=True, overwrite_d=True, overwrite_du=True)
+        if info != 0:
+            raise np.linalg.LinAlgError(f"Tridiagonal matrix is singular (gttrf info = {info})")
+
+    @classmethod
+    def block_diagonal(cls, lower, diag, upper, n, dtype=float):
+        """
+        Factorize K independent constant-coefficient n x n tridiagonal systems as one.
+
+        The blocks are stacked along the diagonal of a single (K n)-sized tridiagonal
+        matrix with zero coupling between consecutive blocks, so one gttrs call solves
+        all K systems; the right-hand side is the C-ordered ravel of a (K, n) array.
+
+        Parameters:
+            lower, diag, upper (np.ndarray): Per-block coefficients, shape (K,).
+            n (int): Size of each block.
+            dtype (np.dtype): float64 or float32, as in the constructor.
+        """
+        lower, diag, upper = np.broadcast_arrays(*(np.atleast_1d(np.asarray(c, dtype=float))
+                                                   for c in (lower, diag, upper)))
+        dl = np.repeat(lower, n)
+        du = np.repeat(upper, n)
+        dl[n - 1::n] = 0.0
+        du[n - 1::n] = 0.0
+        return cls(dl[:-1], np.repeat(diag, n), du[:-1], dtype=dtype)
+
+    def solve(self, b, overwrite_b=False):
+        """
+        Solve A x = b using the stored factorization.
+
+        Parameters:
+            b (np.ndarray): Right-hand side of shape (n,) or (n, k) for k systems.
+            overwrite_b (bool): Allow the solution to be written into b.
+
+        Returns:
+            np.ndarray: Solution x with the same shape as b.
+        """
+        x, info = self._gttrs(self._dl, self._d, self._du, self._du2, self._ipiv, b,
+                                overwrite_b=overwrite_b)
+        if info != 0:
+            raise ValueError(f"Illegal argument passed to gttrs (info = {info})")
+        return x
+
+def three_point_stencil(u, lower, diag, upper, out=None):
+    """
+    Apply a tridiagonal operator to the interior of u as a three-point stencil.
+
+    Computes out[i] = lower * u[i] + diag * u[i + 1] + upper * u[i + 2], i.e. the
+    product of the (n - 2)-sized tridiagonal matrix with u[1:-1], including the
+    contributions of the boundary values u[0] and u[-1]. The stencil acts on the
+    last axis, so a (K, n) array is handled row by row.
+
+    Parameters:
+        u (np.ndarray): Full state, boundary entries included.
+        lower, diag, upper (float or np.ndarray): Stencil weights; shape (K, 1) for
+            one set of weights per row.
+        out (np.ndarray or None): Optional buffer of shape u[..., 1:-1].shape.
+
+    Returns:
+        np.ndarray: The stencil applied to the interior points.
+    """
+    if out is None:
+        out = np.empty(u.shape[:-1] + (u.shape[-1] - 2,))
+    np.multiply(u[..., 1:-1], diag, out=out)
+    out += lower * u[..., :-2]
+    out += upper * u[..., 2:]
+    return out
+
+class _ThomasSolver:
+    """
+    Compiled Thomas algorithm with the TridiagonalSolver.solve interface (numba backend).
+
+    No pivoting is done, which is safe for the diagonally dominant heat-equation matrices.
+    """
+
+    def __init__(self, lower, diag, upper, n):
+        self.n = n
+        self._factors = thomas_factorize(lower, diag, upper, n)
+
+    def solve(self, b, overwrite_b=False):
+        return thomas_solve_kernel(*self._factors, b if overwrite_b else b.copy())
+
+def _interior_solver(r, lower, diag, upper, n, backend='numpy', dtype=float):
+    """TridiagonalSolver for a scalar r, block-diagonal solver for one r per batched problem."""
+    if np.ndim(r) == 0:
+        if resolve_backend(backend) == 'numba' and np.dtype(dtype) == np.float64:
+            return _ThomasSolver(lower, diag, upper, n)
+        return TridiagonalSolver(lower, diag, upper, n=n, dtype=dtype)
+    return TridiagonalSolver.block_diagonal(lower, diag, upper, n, dtype)
+
+def implicit_stepper(r, n_points, backend='numpy', dtype=float):
+    """
+    Build a step(u, u_new) callable for the backward Euler scheme.
+
+    The boundary values of the new level are read from u_new[..., 0] and
+    u_new[..., -1], which must be set before the call.
+
+    Parameters:
+        r (float or np.ndarray): Mesh ratio alpha * dt / dx**2, or one ratio per
+            problem (shape (K,)) to advance K problems stored as a (K, n_points) array.
+        n_points (int): Number of spatial points, boundaries included.
+        backend (str): 'numpy' (LAPACK gttrs), 'numba' or 'auto'; the compiled Thomas
+            solve is used for a scalar float64 r, batched or float32 problems use LAPACK.
+        dtype (np.dtype): float64 or float32. The factorization, the right-hand side
+            and the solve (sgttrs for float32) all use this type, and so should u.
+
+    Returns:
+        callable: step(u, u_new) writing the interior of level n + 1 into u_new.
+    """
+    r = np.asarray(r, dtype=dtype)
+    A = _interior_solver(r, -r, 1 + 2 * r, -r, n_points - 2, backend, dtype)
+    b = np.empty(r.shape + (n_points - 2,), dtype=dtype)
+
+    def step(u, u_new):
+        b[...] = u[..., 1:-1]
+        b[..., 0] += r * u_new[..., 0]
+        b[..., -1] += r * u_new[..., -1]
+        u_new[..., 1:-1] = A.solve(b.reshape(-1), overwrite_b=True).reshape(b.shape)
+        return u_new
+    return step
+
+def crank_nicolson_stepper(r, n_points, backend='numpy', dtype=float):
+    """
+    Build a step(u, u_new) callable for the Crank-Nicolson scheme.
+
+    The boundary values of the new level are read from u_new[..., 0] and
+    u_new[..., -1], which must be set before the call.
+
+    Parameters:
+        r (float or np.ndarray): Mesh ratio alpha * dt / dx**2, or one ratio per
+            problem (shape (K,)) to advance K problems stored as a (K, n_points) array.
+        n_points (int): Number of spatial points, boundaries included.
+        backend (str): 'numpy' (LAPACK gttrs), 'numba' or 'auto'; the compiled Thomas
+            solve is used for a scalar float64 r, batched or float32 problems use LAPACK.
+        dtype (np.dtype): float64 or float32. The factorization, the right-hand side
+            and the solve (sgttrs for float32) all use this type, and so should u.
+
+    Returns:
+        callable: step(u, u_new) writing the interior of level n + 1 into u_new.
+    """
+    r = np.asarray(r, dtype=dtype)
+    A = _interior_solver(r, -r / 2, 1 + r, -r / 2, n_points - 2, backend, dtype)
+    b = np.empty(r.shape + (n_points - 2,), dtype=dtype)
+    off_diag = r[..., None] / 2
+    diag = 1 - r[..., None]
+
+    def step(u, u_new):
+        three_point_stencil(u, off_diag, diag, off_diag, out=b)
+        b[..., 0] += r / 2 * u_new[..., 0]
+        b[..., -1] += r / 2 * u_new[..., -1]
+        u_new[..., 1:-1] = A.solve(b.reshape(-1), overwrite_b=True).reshape(b.shape)
+        return u_new
+    return step
@@ -0,0 +1,144 @@
+from collections import namedtuple
+
+import numpy as np
+
+from .batched import METHODS, solve_heat_equation_batch
+from .parallel import run_tasks
+
+# Order of the error in dx when dt is refined as in time_refinement()
+FORMAL_ORDERS = {'explicit': 2, 'implicit': 1, 'crank_nicolson': 2, 'rk2': 2}
+
+ConvergenceResult = namedtuple('ConvergenceResult',
+                               ['method', 'x_points', 't_points', 'differences', 'orders',
+                                'x', 't', 'extrapolated', 'error_estimate'])
+ConvergenceResult.__doc__ = """
+Outcome of a grid-convergence study.
+
+Fields:
+    method (str): Solver used on every level.
+    x_points, t_points (list of int): Grid sizes of the levels, coarse to fine.
+    differences (np.ndarray): max |u_l - u_(l-1)| between consecutive levels, on the coarser grid.
+    orders (np.ndarray): Observed orders log(d_l / d_(l+1)) / log(refine).
+    x, t (np.ndarray): Grid of the Richardson-extrapolated solution (second finest
+        level in space, coarsest level in time).
+    extrapolated (np.ndarray): Richardson-extrapolated solution, shape (len(t), len(x)).
+    error_estimate (float): Estimated max error of the finest level.
+"""
+
+def time_refinement(method, refine):
+    """Factor by which the number of time steps grows per level; explicit schemes keep r fixed."""
+    return refine**2 if method in ('explicit', 'rk2') else refine
+
+def _solve_level(args):
+    L, T, alpha, x_points, t_points, u0, u_left, u_right, method, stride = args
+    result = solve_heat_equation_batch(L, T, alpha, x_points, t_points, u0, u_left, u_right, method, stride)
+    return result.u[:, 0, :]
+
+class ConvergenceStudy:
+    """
+    Run one of the finite-difference solvers on successively refined grids.
+
+    Level l has (x_points - 1) * refine**l + 1 points in space and a number of steps
+    grown by time_refinement(method, refine) per level, so the error shrinks by
+    refine**p with p = FORMAL_ORDERS[method]. Every level keeps only the time levels
+    of the coarsest grid, and its fields are cached, so extending a study or asking
+    for a tighter tolerance only solves the new levels. Missing levels that are
+    requested together are independent and run as parallel tasks.
+
+    Parameters:
+        L, T, alpha, u0, u_left, u_right: Problem, as in solve_heat_equation_batch; u0
+            must be picklable when n_workers > 1 (e.g. GaussianProfile).
+        method (str): 'explicit', 'implicit', 'crank_nicolson' or 'rk2'.
+        x_points, t_points (int): Grid of level 0.
+        refine (int): Refinement factor in space per level.
+        n_workers (int or None): Worker processes for independent levels; 1 solves in-process.
+    """
+
+    def __init__(self, L, T, alpha, u0, u_left=0.0, u_right=0.0, method='crank_nicolson',
+                 x_points=11, t_points=11, refine=2, n_workers=1):
+        if method not in METHODS:
+            raise ValueError(f"Unknown method '{method}', expected one of {METHODS}")
+        self.problem = (L, T, alpha)
+        self.u0, self.u_left, self.u_right = u0, u_left, u_right
+        self.method = method
+        self.x_points, self.t_points = x_points, t_points
+        self.refine = refine
+        self.time_refine = time_refinement(method, refine)
+        self.n_workers = n_workers
+        self._fields = {}
+
+    def grid(self, level):
+        """(x_points, t_points) of a level."""
+        return ((self.x_points - 1) * self.refine**level + 1,
+                (self.t_points - 1) * self.time_refine**level + 1)
+
+    def solve(self, levels):
+        """Fields of the given levels on the level-0 times, solving only uncached levels."""
+        missing = [level for level in levels if level not in self._fields]
+        L, T, alpha = self.problem
+        arguments = [(L, T, alpha, *self.grid(level), self.u0, self.u_left, self.u_right, self.method,
+                      self.time_refine**level) for level in missing]
+        for level, field in zip(missing, run_tasks(_solve_level, arguments, self.n_workers)):
+            self._fields[level] = field
+        return [self._fields[level] for level in levels]
+
+    def _restricted_difference(self, level):
+        coarse, fine = self.solve([level - 1, level])
+        return np.max(np.abs(fine[:, ::self.refine] - coarse))
+
+    def run(self, n_levels=4, order=None):
+        """
+        Solve levels 0 .. n_levels - 1 and extrapolate from the two finest.
+
+        Parameters:
+            n_levels (int): Number of levels, at least 2 (3 for an observed order).
+            order (float, 'observed' or None): Order used by Richardson extrapolation;
+                None takes the formal order of the method.
+
+        Returns:
+            ConvergenceResult: Differences, observed orders and the extrapolated solution.
+        """
+        if n_levels < 2:
+            raise ValueError(f"At least two levels are needed, got {n_levels}")
+        self.solve(range(n_levels))
+
+        differences = np.array([self._restricted_difference(level) for level in range(1, n_levels)])
+        with np.errstate(divide='ignore', invalid='ignore'):
+            orders = np.log(differences[:-1] / differences[1:]) / np.log(self.refine)
+
+        if order is None:
+            order = FORMAL_ORDERS[self.method]
+        elif order == 'observed':
+            if orders.size == 0:
+                raise ValueError("An observed order needs at least three levels")
+            order = orders[-1]
+
+        coarse, fine = self.solve([n_levels - 2, n_levels - 1])
+        fine = fine[:, ::self.refine]
+        correction = (fine - coarse) / (self.refine**order - 1)
+
+        L, T, _ = self.problem
+        x_points = self.grid(n_levels - 2)[0]
+        return ConvergenceResult(self.method,
+                                 [self.grid(level)[0] for level in range(n_levels)],
+                                 [self.grid(level)[1] for level in range(n_levels)],
+                                 differences, orders,
+                                 np.linspace(0, L, x_points), np.linspace(0, T, self.t_points),
+                                 fine + correction, float(np.max(np.abs(correction))))
+
+    def refine_until(self, tol, max_levels=8, order=None):
+        """
+        Add levels until the estimated error of the finest level is below tol.
+
+        The first three levels are solved together; after that one level is added at a
+        time, so the study stops at the cheapest grid meeting the tolerance.
+
+        Returns:
+            ConvergenceResult: Result of the last study run.
+        """
+        n_levels = min(3, max_levels)
+        while True:
+            result = self.run(n_levels, order)
+            if result.error_estimate <= tol or n_levels >= max_levels:
+                return result
+            n_levels += 1
@@ -0,0 +1,145 @@
+import hashlib
+import os
+import pickle
+import tempfile
+
+import sympy as sp
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'heat_equation')
+
+class SymbolicDiskCache:
+    """
+    Content-addressed on-disk cache for sympy results, shared between processes.
+
+    Keys are SHA-256 digests of the srepr of the inputs (plus the sympy version), so
+    equal expressions map to the same entry across runs. Every entry is one pickle
+    file written to a temporary file and moved into place with os.replace, so readers
+    never see a partial entry and concurrent writers simply race to store the same
+    value. Hits refresh the file's modification time; once the directory grows past
+    max_bytes the least recently used entries are deleted.
+
+    Parameters:
+        directory (str or None): Cache directory; defaults to $HEAT_EQUATION_CACHE_DIR
+            or ~/.cache/heat_equation.
+        max_bytes (int): Size limit of the cache directory.
+    """
+
+    def __init__(self, directory=None, max_bytes=256 * 2**20):
+        if directory is None:
+            directory = os.environ.get('HEAT_EQUATION_CACHE_DIR', DEFAULT_CACHE_DIR)
+        self.directory = directory
+        self.max_bytes = max_bytes
+        os.makedirs(directory, exist_ok=True)
+
+    def key(self, name, *args):
+        """Canonical digest for a named computation on sympy-convertible arguments."""
+        canonical = [name, sp.__version__] + [sp.srepr(sp.sympify(arg)) for arg in args]
+        return hashlib.sha256('\x1f'.join(canonical).encode()).hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + '.pkl')
+
+    def get(self, key, default=None):
+        """Return the cached value for key, or default on a miss."""
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as handle:
+                value = pickle.load(handle)
+        except FileNotFoundError:
+            return default
+        except Exception:
+            # Truncated, corrupt or stale entries (unpickling can raise almost anything,
+            # e.g. AttributeError or ImportError after a code change) count as a miss
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            return default
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            pass  # evicted by another process since we read it
+        return value
+
+    def set(self, key, value):
+        """Store value under key, then evict least recently used entries if over the limit."""
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as handle:
+                pickle.dump(value, handle, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self._path(key))
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        self.evict()
+
+    def evict(self):
+        """Delete least recently used entries until the cache fits in max_bytes."""
+        entries = []
+        for entry in os.scandir(self.directory):
+            if not entry.name.endswith('.pkl'):
+                continue
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+
+    def clear(self):
+        """Delete every entry."""
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith('.pkl'):
+                try:
+                    os.remove(entry.path)
+                except FileNotFoundError:
+                    pass
+
+    def cached(self, name, compute, *args):
+        """Return compute(*args), reading it from or storing it in the cache."""
+        key = self.key(name, *args)
+        value = self.get(key)
+        if value is None:
+            value = compute(*args)
+            self.set(key, value)
+        return value
+
+_default_cache = None
+
+def default_cache():
+    """Process-wide SymbolicDiskCache in the default directory."""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = SymbolicDiskCache()
+    return _default_cache
+
+def _resolve(cache):
+    if cache is False:
+        return None
+    if cache is None or cache is True:
+        return default_cache()
+    return cache
+
+def cached_simplify(expr, cache=None):
+    """
+    sp.simplify(expr) through the disk cache.
+
+    Parameters:
+        expr (sympy expression): Expression to simplify.
+        cache (SymbolicDiskCache, bool or None): Cache to use; None or True selects the
+            default cache and False disables caching.
+    """
+    cache = _resolve(cache)
+    if cache is None:
+        return sp.simplify(expr)
+    return cache.cached('simplify', sp.simplify, expr)
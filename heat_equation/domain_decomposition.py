@@ -0,0 +1,110 @@
+import os
+import multiprocessing
+from multiprocessing import shared_memory
+from threading import BrokenBarrierError
+
+import numpy as np
+
+from .stencil import ftcs_step
+from .multidim import ftcs_step_nd
+
+def slab_bounds(n_points, n_workers):
+    """
+    Split the interior rows 1 .. n_points - 2 into n_workers contiguous slabs.
+
+    Returns:
+        list of (int, int): Half-open row ranges [start, stop), one per worker.
+    """
+    edges = np.linspace(1, n_points - 1, n_workers + 1).round().astype(int)
+    return list(zip(edges[:-1], edges[1:]))
+
+def _slab_worker(buffers, shape, r, start, stop, n_steps, barrier):
+    fields = [np.ndarray(shape, dtype=float, buffer=shm.buf) for shm in buffers]
+    step = ftcs_step if len(shape) == 1 else ftcs_step_nd
+    u = u_new = None
+    try:
+        for n in range(n_steps):
+            u, u_new = fields[n % 2], fields[(n + 1) % 2]
+            # The slab plus one halo row on each side; the halo rows belong to the
+            # neighbours (or are boundary values) and are only read
+            step(u[start - 1:stop + 1], u_new[start - 1:stop + 1], r)
+            barrier.wait()
+    except BrokenBarrierError:
+        pass
+    finally:
+        # Release the views before the shared buffers are closed at exit
+        del u, u_new, fields
+
+def decomposed_ftcs(u_init, r, n_steps, n_workers=None):
+    """
+    March the explicit scheme with the domain split into slabs across worker processes.
+
+    Both time levels live in multiprocessing.shared_memory. Every worker advances its
+    own slab of rows along the first axis and reads only the one-cell halo rows owned
+    by its neighbours directly from the shared field; a barrier per step orders the
+    exchange, so no array is ever pickled. The update is element-wise identical to
+    ftcs_march / ftcs_stepper_nd, so the result matches the serial solver exactly.
+
+    The barrier costs tens of microseconds per step, so splitting only pays off once
+    every slab holds well over ~10^5 points.
+
+    Parameters:
+        u_init (np.ndarray): Initial state of shape (N,) or (N, M), boundary values included;
+            the boundary values stay fixed.
+        r (float or sequence of float): Mesh ratio alpha * dt / dx**2; one per axis in 2D.
+        n_steps (int): Number of time steps.
+        n_workers (int or None): Number of worker processes; None uses all cores and
+            1 runs the serial stepper in the calling process.
+
+    Returns:
+        np.ndarray: Final state after n_steps steps.
+    """
+    u_init = np.array(u_init, dtype=float)
+    if u_init.ndim not in (1, 2):
+        raise ValueError(f"Expected a 1D or 2D field, got {u_init.ndim} dimensions")
+    if u_init.ndim == 2:
+        r = tuple(float(r_axis) for r_axis in r)
+    else:
+        r = float(r)
+
+    if n_workers is None:
+        n_workers = os.cpu_count() or 1
+    n_workers = max(1, min(n_workers, u_init.shape[0] - 2))
+
+    if n_workers == 1:
+        step = ftcs_step if u_init.ndim == 1 else ftcs_step_nd
+        u, u_new = u_init, u_init.copy()
+        for _ in range(n_steps):
+            step(u, u_new, r)
+            u, u_new = u_new, u
+        return u
+
+    buffers = [shared_memory.SharedMemory(create=True, size=u_init.nbytes) for _ in range(2)]
+    try:
+        for shm in buffers:
+            np.ndarray(u_init.shape, dtype=float, buffer=shm.buf)[...] = u_init
+
+        barrier = multiprocessing.Barrier(n_workers)
+        workers = [multiprocessing.Process(target=_slab_worker,
+                                           args=(buffers, u_init.shape, r, start, stop, n_steps, barrier))
+                   for start, stop in slab_bounds(u_init.shape[0], n_workers)]
+        for worker in workers:
+            worker.start()
+
+        # A worker that dies would leave the others waiting at the barrier forever
+        failed = False
+        while any(worker.is_alive() for worker in workers):
+            for worker in workers:
+                worker.join(timeout=0.1)
+                if worker.exitcode not in (None, 0) and not failed:
+                    failed = True
+                    barrier.abort()
+        if failed or any(worker.exitcode != 0 for worker in workers):
+            raise RuntimeError("A domain-decomposition worker exited with an error")
+
+        result = np.ndarray(u_init.shape, dtype=float, buffer=buffers[n_steps % 2].buf).copy()
+    finally:
+        for shm in buffers:
+            shm.close()
+            shm.unlink()
+    return result
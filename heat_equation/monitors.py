@@ -0,0 +1,142 @@
+from collections import namedtuple
+
+import numpy as np
+
+from .streaming import Energy, Reducer
+
+class Violation(namedtuple('Violation', ['bound', 'level', 'time', 'index', 'value', 'limit'])):
+    """
+    First time level at which a monitored bound failed.
+
+    Fields:
+        bound (str): Name of the bound.
+        level (int): Time level (0 is the initial state).
+        time (float): Time of that level.
+        index (int or None): Grid index where it failed, None for integral bounds.
+        value (float): Offending value.
+        limit (float): Bound it exceeded.
+    """
+    __slots__ = ()
+
+    def __str__(self):
+        where = f" at grid index {self.index}" if self.index is not None else ""
+        return (f"{self.bound} violated at t = {self.time:.6g} (level {self.level}){where}: "
+                f"value {self.value:.12g}, limit {self.limit:.12g}")
+
+class BoundMonitor(Reducer):
+    """
+    Reducer that checks a bound on every time level in O(N) and records the first violation.
+
+    With stop_on_violation, stream_states stops marching right after the violating
+    level (which is still yielded), so a broken run is not continued to the end.
+
+    Parameters:
+        stop_on_violation (bool): Ask stream_states to stop at the first violation.
+        tol (float): Absolute slack allowed for round-off.
+    """
+
+    def __init__(self, stop_on_violation=True, tol=1e-12):
+        super().__init__()
+        self.stop_on_violation = stop_on_violation
+        self.tol = tol
+        self.violation = None
+
+    def __call__(self, t, u):
+        level = len(self.times)
+        super().__call__(t, u)
+        if self.violation is None:
+            self.violation = self.check(level, t, u, self.values[-1])
+
+    def check(self, level, t, u, value):
+        """Return a Violation for this level, or None."""
+        raise NotImplementedError
+
+    @property
+    def stop(self):
+        return self.stop_on_violation and self.violation is not None
+
+class MaximumPrincipleMonitor(BoundMonitor):
+    """
+    min(initial and boundary data) <= u <= max(initial and boundary data) on every level.
+
+    The bounds default to the range of the first level seen, boundary entries included,
+    which is the discrete maximum principle for constant Dirichlet data.
+
+    Parameters:
+        lower, upper (float or None): Explicit bounds.
+    """
+
+    def __init__(self, lower=None, upper=None, stop_on_violation=True, tol=1e-12):
+        super().__init__(stop_on_violation, tol)
+        self.lower = lower
+        self.upper = upper
+
+    def evaluate(self, u):
+        return np.min(u), np.max(u)
+
+    def check(self, level, t, u, value):
+        if self.upper is None:
+            self.upper = value[1]
+        if self.lower is None:
+            self.lower = value[0]
+        if value[1] > self.upper + self.tol:
+            return Violation('maximum principle (upper)', level, t, int(np.argmax(u)), value[1], self.upper)
+        if value[0] < self.lower - self.tol:
+            return Violation('maximum principle (lower)', level, t, int(np.argmin(u)), value[0], self.lower)
+        return None
+
+class EnergyMonitor(Energy, BoundMonitor):
+    """
+    Energy ||u(., t)||^2 that must not increase from one level to the next.
+
+    The energy of the heat equation with homogeneous Dirichlet data is non-increasing;
+    with nonzero boundary values pass monotone=False to only record it.
+
+    Parameters:
+        dx (float): Grid spacing.
+        rule (str): 'trapezoid' or 'rectangle', as in Energy.
+        monotone (bool): Check that the energy does not increase.
+        rtol (float): Relative slack on the increase.
+    """
+
+    def __init__(self, dx, rule='trapezoid', monotone=True, rtol=1e-12, stop_on_violation=True, tol=1e-15):
+        Energy.__init__(self, dx, rule)
+        self.stop_on_violation = stop_on_violation
+        self.tol = tol
+        self.monotone = monotone
+        self.rtol = rtol
+
+    def check(self, level, t, u, value):
+        if not self.monotone or level == 0:
+            return None
+        previous = self.values[-2]
+        limit = previous * (1 + self.rtol) + self.tol
+        if value > limit:
+            return Violation('energy decay', level, t, None, value, limit)
+        return None
+
+class CauchySchwarzMonitor(BoundMonitor):
+    """
+    Norm bound ||u(t)|| <= ||u(0)|| from the Cauchy-Schwarz energy estimate, on every level.
+
+    The recorded value is ||u(t)|| (rectangle rule, sum(u**2) * dx), the bound plotted
+    by the Cauchy-Schwarz script. The inequality |<u, v>| <= ||u|| ||v|| itself holds
+    for any discrete vectors, so only the decay of the norm is checked.
+
+    Parameters:
+        dx (float): Grid spacing.
+        monotone (bool): Check that ||u(t)|| does not exceed ||u(0)||.
+    """
+
+    def __init__(self, dx, monotone=True, stop_on_violation=True, tol=1e-12):
+        super().__init__(stop_on_violation, tol)
+        self.dx = dx
+        self.monotone = monotone
+
+    def evaluate(self, u):
+        return np.sqrt(np.dot(u, u) * self.dx)
+
+    def check(self, level, t, u, value):
+        if self.monotone and value > self.values[0] + self.tol:
+            return Violation('norm decay', level, t, None, value, self.values[0])
+        return None
@@ -0,0 +1,212 @@
+import numpy as np
+
+from .jit import random_walk_kernel, resolve_backend
+from .parallel import run_tasks
+
+class GaussianProfile:
+    """
+    Picklable Gaussian peak exp(-sharpness * (x - center)**2), usable in worker processes.
+
+    Parameters:
+        center (float): Location of the peak.
+        sharpness (float): Coefficient in the exponent.
+    """
+
+    def __init__(self, center, sharpness=100.0):
+        self.center = center
+        self.sharpness = sharpness
+
+    def __call__(self, x):
+        return np.exp(-self.sharpness * (x - self.center)**2)
+
+def _walk_block(x_start, f, L, dx, n_steps, n_particles, boundary, rng, backend='numpy'):
+    """Run n_particles walkers from every point of x_start; return sums of f(X_end) and f(X_end)**2."""
+    if backend == 'numba':
+        # Per-walker loops with an early exit on the first boundary hit, seeded from rng
+        seed = int(rng.integers(np.iinfo(np.int32).max))
+        pos = random_walk_kernel(x_start, n_particles, L, dx, n_steps, boundary == 'absorbing', seed)
+        values = f(pos)
+        return np.sum(values, axis=1), np.sum(values**2, axis=1)
+
+    pos = np.repeat(x_start[:, None], n_particles, axis=1)
+
+    if boundary == 'absorbing':
+        alive = np.ones(pos.shape, dtype=bool)
+        for _ in range(n_steps):
+            steps = rng.integers(0, 2, size=pos.shape, dtype=np.int8)
+            # Walkers that already hit the boundary keep their exit position
+            pos += np.where(alive, (2 * steps - 1) * dx, 0.0)
+            alive &= (pos > 0) & (pos < L)
+            if not alive.any():
+                break
+    else:
+        for _ in range(n_steps):
+            steps = rng.integers(0, 2, size=pos.shape, dtype=np.int8)
+            pos += (2 * steps - 1) * dx
+            np.abs(pos, out=pos)
+            np.subtract(2 * L, pos, out=pos, where=pos > L)
+
+    values = f(pos)
+    return np.sum(values, axis=1), np.sum(values**2, axis=1)
+
+def _walk_sums(starts, f, L, dx, n_steps, n_particles, boundary, rng, max_walkers, backend='numpy'):
+    """Chunked driver around _walk_block; returns per-start sums and sums of squares."""
+    # Split the (start, particle) grid into blocks of at most max_walkers walkers
+    particles_per_block = max(1, min(n_particles, max_walkers // max(1, starts.size)))
+    starts_per_block = max(1, max_walkers // particles_per_block)
+
+    totals = np.zeros(starts.size)
+    totals_sq = np.zeros(starts.size)
+    for s in range(0, starts.size, starts_per_block):
+        block = starts[s:s + starts_per_block]
+        for p in range(0, n_particles, particles_per_block):
+            count = min(particles_per_block, n_particles - p)
+            block_sum, block_sq = _walk_block(block, f, L, dx, n_steps, count, boundary, rng, backend)
+            totals[s:s + starts_per_block] += block_sum
+            totals_sq[s:s + starts_per_block] += block_sq
+
+    return totals, totals_sq
+
+def _check_boundary(boundary):
+    if boundary not in ('absorbing', 'reflecting'):
+        raise ValueError(f"Unknown boundary '{boundary}', expected 'absorbing' or 'reflecting'")
+
+def random_walk_expectation(x_start, f, L, dx, n_steps, n_particles, boundary='absorbing',
+                            seed=None, max_walkers=1_000_000, backend='numpy'):
+    """
+    Estimate E[f(X_n)] for symmetric +/-dx random walks started at every point of x_start.
+
+    All walkers of a block are advanced together with boolean masks, and the work is
+    split into blocks of at most max_walkers walkers so memory stays bounded no matter
+    how large n_particles is.
+
+    Parameters:
+        x_start (np.ndarray): Starting positions.
+        f (callable): Vectorized function evaluated at the walkers' final positions.
+        L (float): Length of the domain [0, L].
+        dx (float): Step length.
+        n_steps (int): Number of steps per walker.
+        n_particles (int): Number of walkers per starting position.
+        boundary (str): 'absorbing' (a walker stops where it leaves (0, L)) or
+            'reflecting' (walkers are mirrored back into [0, L]).
+        seed (int, np.random.SeedSequence, np.random.Generator or None): Seed for
+            np.random.default_rng; the same seed reproduces the same estimate.
+        max_walkers (int): Maximum number of walkers held in memory at once.
+        backend (str): 'numpy', 'numba' or 'auto'; see heat_equation.jit. The compiled
+            walker draws from its own generator, so estimates for a given seed differ
+            between backends (they agree statistically).
+
+    Returns:
+        np.ndarray: Estimate of E[f(X_n)] with the shape of x_start.
+    """
+    _check_boundary(boundary)
+    backend = resolve_backend(backend)
+    rng = np.random.default_rng(seed)
+    x_start = np.asarray(x_start, dtype=float)
+
+    totals, _ = _walk_sums(x_start.ravel(), f, L, dx, n_steps, n_particles, boundary, rng, max_walkers, backend)
+    return (totals / n_particles).reshape(x_start.shape)
+
+def _split(n_items, n_tasks):
+    """Sizes of n_tasks nearly equal, non-empty parts of n_items."""
+    n_tasks = max(1, min(n_tasks, n_items))
+    base, extra = divmod(n_items, n_tasks)
+    return [base + 1] * extra + [base] * (n_tasks - extra)
+
+def _walk_task(args):
+    starts, f, L, dx, n_steps, n_particles, boundary, seed_seq, max_walkers, backend = args
+    rng = np.random.default_rng(seed_seq)
+    return _walk_sums(starts, f, L, dx, n_steps, n_particles, boundary, rng, max_walkers, backend)
+
+def parallel_random_walk_expectation(x_start, f, L, dx, n_steps, n_particles, boundary='absorbing',
+                                     seed=None, n_workers=None, n_tasks=64, max_walkers=1_000_000,
+                                     backend='numpy'):
+    """
+    Multi-process version of random_walk_expectation with a standard error estimate.
+
+    The particles are split into n_tasks tasks. Each task draws from its own child of
+    SeedSequence(seed).spawn, and the per-task sums and sums of squares are merged in
+    task order. Streams belong to tasks rather than processes, so for a given seed,
+    n_tasks and max_walkers the estimate is identical whatever n_workers is.
+
+    Parameters:
+        x_start, f, L, dx, n_steps, n_particles, boundary: As in random_walk_expectation.
+            f must be picklable (e.g. GaussianProfile or a module-level function).
+        seed (int, np.random.SeedSequence or None): Root seed.
+        n_workers (int or None): Number of worker processes; None uses all cores and
+            1 runs every task in the calling process.
+        n_tasks (int): Number of independent particle batches.
+        max_walkers (int): Maximum number of walkers held in memory per worker.
+        backend (str): 'numpy', 'numba' or 'auto', as in random_walk_expectation.
+
+    Returns:
+        mean (np.ndarray): Estimate of E[f(X_n)] with the shape of x_start.
+        stderr (np.ndarray): Standard error of the estimate.
+    """
+    _check_boundary(boundary)
+    backend = resolve_backend(backend)
+    x_start = np.asarray(x_start, dtype=float)
+    starts = x_start.ravel()
+
+    root = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+    sizes = _split(n_particles, n_tasks)
+    arguments = [(starts, f, L, dx, n_steps, size, boundary, child, max_walkers, backend)
+                 for size, child in zip(sizes, root.spawn(len(sizes)))]
+
+    totals = np.zeros(starts.size)
+    totals_sq = np.zeros(starts.size)
+    for task_sum, task_sq in run_tasks(_walk_task, arguments, n_workers):
+        totals += task_sum
+        totals_sq += task_sq
+
+    mean = totals / n_particles
+    variance = np.maximum(totals_sq / n_particles - mean**2, 0.0) * n_particles / max(1, n_particles - 1)
+    stderr = np.sqrt(variance / n_particles)
+    return mean.reshape(x_start.shape), stderr.reshape(x_start.shape)
+
+def _density_task(args):
+    n_particles, num_steps, domain_length, dx, jump_prob, x_points, seed_seq = args
+    rng = np.random.default_rng(seed_seq)
+
+    positions = rng.uniform(0, domain_length, size=n_particles)
+    counts = np.empty((num_steps, x_points), dtype=np.int64)
+    for step in range(num_steps):
+        moves = rng.choice([-1, 0, 1], size=n_particles, p=[jump_prob / 2, 1 - jump_prob, jump_prob / 2])
+        positions += moves * dx
+        np.clip(positions, 0, domain_length, out=positions)
+        counts[step], _ = np.histogram(positions, bins=x_points, range=(0, domain_length))
+    return counts
+
+def lattice_walk_density(num_particles, num_steps, domain_length, dx, jump_prob, x_points,
+                         seed=None, n_workers=None, n_tasks=64):
+    """
+    Particle density of a lazy lattice walk (stay with probability 1 - jump_prob), run on a process pool.
+
+    Particles start uniformly in [0, domain_length] and are clipped at its ends. Each
+    task simulates a share of the particles on its own SeedSequence child stream and
+    returns bin counts, which are summed in task order.
+
+    Parameters:
+        num_particles (int): Total number of particles.
+        num_steps (int): Number of time steps.
+        domain_length (float): Length of the spatial domain.
+        dx (float): Spatial step size.
+        jump_prob (float): Probability of moving to a neighbouring site in one step.
+        x_points (int): Number of histogram bins.
+        seed (int, np.random.SeedSequence or None): Root seed.
+        n_workers (int or None): Number of worker processes; None uses all cores.
+        n_tasks (int): Number of independent particle batches.
+
+    Returns:
+        density (np.ndarray): Fraction of particles per bin, shape (num_steps, x_points).
+        stderr (np.ndarray): Binomial standard error of each density value.
+    """
+    root = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+    sizes = _split(num_particles, n_tasks)
+    arguments = [(size, num_steps, domain_length, dx, jump_prob, x_points, child)
+                 for size, child in zip(sizes, root.spawn(len(sizes)))]
+
+    counts = sum(run_tasks(_density_task, arguments, n_workers))
+    density = counts / num_particles
+    stderr = np.sqrt(density * (1 - density) / max(1, num_particles - 1))
+    return density, stderr
@@ -0,0 +1,280 @@
+"""
+Explicit, implicit and Crank-Nicolson steppers for the heat equation in 2D and 3D.
+
+All steppers act on a full array of shape (n_1, ..., n_d) whose outer faces hold
+Dirichlet values, and follow the step(u, u_new) convention of the 1D steppers: the
+boundary faces of the new level are read from u_new and only its interior is written.
+
+Two implicit back ends are provided:
+
+- 'sparse': the interior operator is the Kronecker sum of 1D second differences,
+  assembled once with scipy.sparse and factorized once with SuperLU.
+- 'adi': Douglas alternating-direction splitting, each sweep being one batched
+  tridiagonal solve (LAPACK gttrs) along one axis for all grid lines at once.
+  Unconditionally stable, but mixed modes are damped only weakly once every r_i is
+  much larger than 1, so for a few huge steps towards steady state prefer 'sparse'.
+
+Memory for a 512^3 grid (510^3 ~ 1.33e8 interior unknowns, float64):
+
+- one field is 1.07 GB; the explicit stepper holds two fields (~2.1 GB) plus the
+  solution history that is kept (see `stride`).
+- 'adi' holds the two fields, the explicit predictor and one sweep buffer (~4.3 GB);
+  its tridiagonal factors are O(n) per axis and negligible.
+- 'sparse' needs ~9.3e8 non-zeros for the 7-point operator alone (~11 GB with int32
+  indices) and the LU fill-in of a 3D Laplacian grows like N^(4/3), i.e. several TB,
+  so it is only practical up to roughly 100^3 in 3D; use 'adi' beyond that.
+"""
+import numpy as np
+from scipy import sparse
+from scipy.sparse.linalg import splu
+
+from .banded import TridiagonalSolver
+
+def _interior(ndim):
+    return (slice(1, -1),) * ndim
+
+def _shifted(ndim, axis, start, stop):
+    index = [slice(1, -1)] * ndim
+    index[axis] = slice(start, stop)
+    return tuple(index)
+
+def second_differences(u, r, out=None):
+    """
+    Apply sum_i r_i * (u[.., i-1, ..] - 2 u + u[.., i+1, ..]) to the interior of u.
+
+    This is the 5-point (2D) or 7-point (3D) stencil, boundary values included.
+
+    Parameters:
+        u (np.ndarray): Full state, boundary faces included.
+        r (sequence of float): Mesh ratio alpha * dt / dx_i**2 for every axis.
+        out (np.ndarray or None): Optional buffer of shape u[1:-1, ..., 1:-1].shape.
+
+    Returns:
+        np.ndarray: The stencil applied to the interior points.
+    """
+    ndim = u.ndim
+    centre = u[_interior(ndim)]
+    if out is None:
+        out = np.empty(centre.shape)
+    np.multiply(centre, -2 * sum(r), out=out)
+    for axis, r_axis in enumerate(r):
+        out += r_axis * u[_shifted(ndim, axis, None, -2)]
+        out += r_axis * u[_shifted(ndim, axis, 2, None)]
+    return out
+
+def _add_boundary_terms(u, r, theta, out):
+    """Add theta times the contribution of the boundary faces of u to the stencil at the interior points."""
+    ndim = u.ndim
+    for axis, r_axis in enumerate(r):
+        for face, start, stop in ((0, 0, 1), (-1, -1, None)):
+            target = [slice(None)] * ndim
+            target[axis] = face
+            out[tuple(target)] += theta * r_axis * u[_shifted(ndim, axis, start, stop)].squeeze(axis)
+    return out
+
+def ftcs_step_nd(u, u_new, r):
+    """
+    Advance the interior of a 2D or 3D field by one FTCS step, writing into u_new.
+
+    The boundary faces of u_new are left untouched. Stable for sum(r) <= 1/2.
+
+    Parameters:
+        u (np.ndarray): Solution at time level n.
+        u_new (np.ndarray): Preallocated buffer for time level n + 1 (same shape as u).
+        r (sequence of float): Mesh ratio alpha * dt / dx_i**2 for every axis.
+
+    Returns:
+        np.ndarray: u_new.
+    """
+    interior = u_new[_interior(u.ndim)]
+    second_differences(u, r, out=interior)
+    interior += u[_interior(u.ndim)]
+    return u_new
+
+def ftcs_stepper_nd(r):
+    """Build a step(u, u_new) callable for the 2D/3D explicit scheme."""
+    r = tuple(float(r_axis) for r_axis in r)
+
+    def step(u, u_new):
+        return ftcs_step_nd(u, u_new, r)
+    return step
+
+def laplacian_kron(shape, r, format='csc'):
+    """
+    Kronecker-sum operator sum_i r_i D_i on the interior points of a grid of the given shape.
+
+    D_i is the 1D second difference (1, -2, 1) along axis i with homogeneous Dirichlet
+    ends; the unknowns are the C-ordered ravel of the interior block.
+
+    Parameters:
+        shape (tuple of int): Grid shape, boundary points included.
+        r (sequence of float): Mesh ratio for every axis.
+        format (str): Sparse format of the result.
+
+    Returns:
+        scipy.sparse matrix: Operator of size prod(n_i - 2).
+    """
+    sizes = [n - 2 for n in shape]
+    operator = sparse.csr_matrix((int(np.prod(sizes)),) * 2)
+    for axis, (n, r_axis) in enumerate(zip(sizes, r)):
+        d2 = sparse.diags([1.0, -2.0, 1.0], [-1, 0, 1], shape=(n, n)) * r_axis
+        factors = [sparse.identity(m, format='csr') for m in sizes]
+        factors[axis] = d2
+        term = factors[0]
+        for factor in factors[1:]:
+            term = sparse.kron(term, factor, format='csr')
+        operator = operator + term
+    return operator.asformat(format)
+
+def _sparse_stepper(r, shape, theta):
+    operator = laplacian_kron(shape, r)
+    lu = splu(sparse.identity(operator.shape[0], format='csc') - theta * operator)
+    interior_shape = tuple(n - 2 for n in shape)
+    b = np.empty(interior_shape)
+    interior = _interior(len(shape))
+
+    def step(u, u_new):
+        if theta < 1:
+            second_differences(u, r, out=b)
+            np.multiply(b, 1 - theta, out=b)
+            np.add(b, u[interior], out=b)
+        else:
+            b[...] = u[interior]
+        _add_boundary_terms(u_new, r, theta, b)
+        u_new[interior] = lu.solve(b.ravel()).reshape(interior_shape)
+        return u_new
+    return step
+
+def _adi_stepper(r, shape, theta):
+    ndim = len(shape)
+    solvers = [TridiagonalSolver(-theta * r_axis, 1 + 2 * theta * r_axis, -theta * r_axis, n=n - 2)
+               for n, r_axis in zip(shape, r)]
+    interior_shape = tuple(n - 2 for n in shape)
+    interior = _interior(ndim)
+    predictor = np.empty(interior_shape)
+    explicit = np.empty(interior_shape)
+
+    def step(u, u_new):
+        # Douglas splitting: explicit predictor with the full operator, then one
+        # implicit correction per axis
+        second_differences(u, r, out=explicit)
+        np.add(u[interior], explicit, out=predictor)
+        for axis, (r_axis, solver) in enumerate(zip(r, solvers)):
+            d2 = np.diff(u, 2, axis=axis)[_shifted(ndim, axis, None, None)]
+            np.subtract(predictor, theta * r_axis * d2, out=predictor)
+            # Boundary faces of the new level enter the first and last unknown of every line
+            _add_boundary_terms(u_new, (0.0,) * axis + (r_axis,), theta, predictor)
+
+            lines = np.moveaxis(predictor, axis, 0)
+            solved = solver.solve(lines.reshape(lines.shape[0], -1))
+            lines[...] = solved.reshape(lines.shape)
+        u_new[interior] = predictor
+        return u_new
+    return step
+
+def _implicit_nd(r, shape, theta, solver):
+    r = tuple(float(r_axis) for r_axis in r)
+    shape = tuple(shape)
+    if len(r) != len(shape):
+        raise ValueError(f"Expected one mesh ratio per axis, got {len(r)} for a {len(shape)}D grid")
+    if solver == 'sparse':
+        return _sparse_stepper(r, shape, theta)
+    if solver == 'adi':
+        return _adi_stepper(r, shape, theta)
+    raise ValueError(f"Unknown solver '{solver}', expected 'sparse' or 'adi'")
+
+def implicit_stepper_nd(r, shape, solver='adi'):
+    """
+    Build a step(u, u_new) callable for the 2D/3D backward Euler scheme.
+
+    The boundary faces of the new level are read from u_new, which must be set
+    before the call.
+
+    Parameters:
+        r (sequence of float): Mesh ratio alpha * dt / dx_i**2 for every axis.
+        shape (tuple of int): Grid shape, boundary points included.
+        solver (str): 'sparse' (factorized Kronecker-sum operator) or 'adi'
+            (Douglas splitting with batched tridiagonal solves).
+
+    Returns:
+        callable: step(u, u_new) writing the interior of level n + 1 into u_new.
+    """
+    return _implicit_nd(r, shape, 1.0, solver)
+
+def crank_nicolson_stepper_nd(r, shape, solver='adi'):
+    """
+    Build a step(u, u_new) callable for the 2D/3D Crank-Nicolson scheme.
+
+    Same conventions as implicit_stepper_nd; the 'adi' solver is the second-order
+    Douglas scheme with theta = 1/2.
+    """
+    return _implicit_nd(r, shape, 0.5, solver)
+
+def solve_heat_equation_nd(L, T, alpha, x_points, t_points, u0, u_boundary=0.0,
+                           method='crank_nicolson', solver='adi', stride=1):
+    """
+    Solve the heat equation u_t = alpha * laplacian(u) on a 2D or 3D box with Dirichlet faces.
+
+    Parameters:
+        L (sequence of float): Length of the box along every axis.
+        T (float): Total time duration.
+        alpha (float): Thermal diffusivity.
+        x_points (sequence of int): Number of grid points along every axis.
+        t_points (int): Number of time points.
+        u0 (callable): Initial condition u0(x, y[, z]) on broadcastable coordinate arrays.
+        u_boundary (float or callable): Dirichlet value on all faces, constant or a
+            function of the coordinates like u0.
+        method (str): 'explicit', 'implicit' or 'crank_nicolson'.
+        solver (str): Implicit back end, 'sparse' or 'adi'; ignored by 'explicit'.
+        stride (int): Keep every stride-th time level (the last level is always kept).
+
+    Returns:
+        axes, t, u: Grid coordinates per axis, the kept times, and the solution of
+        shape (len(t),) + tuple(x_points).
+    """
+    L = tuple(float(length) for length in L)
+    shape = tuple(int(n) for n in x_points)
+    if len(L) != len(shape) or len(shape) not in (2, 3):
+        raise ValueError("L and x_points must both describe a 2D or 3D grid")
+
+    dt = T / (t_points - 1)
+    r = tuple(alpha * dt / (length / (n - 1))**2 for length, n in zip(L, shape))
+
+    if method == 'explicit':
+        if sum(r) > 0.5:
+            raise ValueError(f"Stability condition not met: sum(r) = {sum(r)} > 0.5")
+        step = ftcs_stepper_nd(r)
+    elif method == 'implicit':
+        step = implicit_stepper_nd(r, shape, solver)
+    elif method == 'crank_nicolson':
+        step = crank_nicolson_stepper_nd(r, shape, solver)
+    else:
+        raise ValueError(f"Unknown method '{method}', expected 'explicit', 'implicit' or 'crank_nicolson'")
+
+    axes = [np.linspace(0, length, n) for length, n in zip(L, shape)]
+    coords = np.meshgrid(*axes, indexing='ij', sparse=True)
+
+    u = np.empty(shape)
+    u[...] = u0(*coords)
+    boundary = np.broadcast_to(u_boundary(*coords) if callable(u_boundary) else u_boundary, shape)
+    interior = _interior(len(shape))
+    interior_values = u[interior].copy()
+    u[...] = boundary
+    u[interior] = interior_values
+    u_new = u.copy()
+
+    kept = list(range(0, t_points, stride))
+    if kept[-1] != t_points - 1:
+        kept.append(t_points - 1)
+    history = np.empty((len(kept),) + shape)
+    history[0] = u
+
+    slot = 1
+    for n in range(1, t_points):
+        step(u, u_new)
+        u, u_new = u_new, u
+        if slot < len(kept) and kept[slot] == n:
+            history[slot] = u
+            slot += 1
+
+    return axes, np.linspace(0, T, t_points)[kept], history
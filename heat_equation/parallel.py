@@ -0,0 +1,22 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+def run_tasks(task, arguments, n_workers=None):
+    """
+    Evaluate task(args) for every entry of arguments, keeping the input order.
+
+    Parameters:
+        task (callable): Picklable module-level function of one argument.
+        arguments (list): Task arguments.
+        n_workers (int or None): Number of worker processes; None uses all cores and
+            1 runs every task in the calling process.
+
+    Returns:
+        list: Results in the order of arguments.
+    """
+    if n_workers is None:
+        n_workers = os.cpu_count() or 1
+    if n_workers <= 1 or len(arguments) <= 1:
+        return [task(args) for args in arguments]
+    with ProcessPoolExecutor(max_workers=min(n_workers, len(arguments))) as pool:
+        return list(pool.map(task, arguments))
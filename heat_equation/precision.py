@@ -0,0 +1,156 @@
+from collections import namedtuple
+
+import numpy as np
+
+from .store import CHUNK_BYTES
+
+PRECISIONS = ('float64', 'float32', 'mixed')
+
+def resolve_precision(dtype):
+    """
+    Split a precision option into (compute dtype, storage dtype).
+
+    'float64' and 'float32' step and store in that type; 'mixed' steps in float64 and
+    rounds every stored time level to float32, halving the memory of the history
+    without letting round-off accumulate from step to step.
+
+    Parameters:
+        dtype (str or np.dtype): 'float64', 'float32' or 'mixed'.
+
+    Returns:
+        tuple of np.dtype: Dtype of the working state and of the stored history.
+    """
+    if isinstance(dtype, str) and dtype == 'mixed':
+        return np.dtype(np.float64), np.dtype(np.float32)
+    try:
+        resolved = np.dtype(dtype)
+    except TypeError:
+        resolved = None
+    if resolved is None or resolved.name not in ('float64', 'float32'):
+        raise ValueError(f"Unknown dtype '{dtype}', expected one of {PRECISIONS}")
+    return resolved, resolved
+
+def resolve_storage_precision(dtype, solver):
+    """
+    Storage dtype for a solver that always steps in float64.
+
+    Parameters:
+        dtype (str or np.dtype): 'float64' or 'mixed'.
+        solver (str): Name used in the error message.
+
+    Returns:
+        np.dtype: Dtype of the stored history.
+    """
+    compute, storage = resolve_precision(dtype)
+    if compute != np.float64:
+        raise ValueError(f"{solver} steps in float64 only; use dtype 'float64' or 'mixed', not '{dtype}'")
+    return storage
+
+def march_history(step, u_init, history):
+    """
+    Fill rows 1, 2, ... of history by repeated step(u, u_new) calls from u_init.
+
+    If history has the dtype of u_init the steps write straight into its rows, whose
+    boundary entries must already hold the Dirichlet values. Otherwise the state is
+    advanced in two buffers of u_init's dtype, with the boundary values of u_init,
+    and each level is rounded only when it is stored.
+
+    Parameters:
+        step (callable): step(u, u_new) writing the interior of the next level.
+        u_init (np.ndarray): Initial state in the compute dtype, boundary entries included.
+        history (np.ndarray): Array of shape (n_levels, len(u_init)) in the storage dtype.
+
+    Returns:
+        np.ndarray: history.
+    """
+    history[0] = u_init
+    if history.dtype == u_init.dtype:
+        for n in range(history.shape[0] - 1):
+            step(history[n], history[n + 1])
+        return history
+
+    u = u_init.copy()
+    u_new = u_init.copy()
+    for n in range(history.shape[0] - 1):
+        step(u, u_new)
+        history[n + 1] = u_new
+        u, u_new = u_new, u
+    return history
+
+class PrecisionReport(namedtuple('PrecisionReport', ['dtype', 'max_abs_error', 'max_rel_error', 'level_errors',
+                                                     'eps', 'tolerance', 'safe'])):
+    """
+    Error of a reduced-precision solution against its float64 reference.
+
+    Fields:
+        dtype (str): Precision option of the reduced run.
+        max_abs_error (float): max |u - u_ref| over all stored levels.
+        max_rel_error (float): max_abs_error / max |u_ref|.
+        level_errors (np.ndarray): max |u - u_ref| of every time level, showing whether
+            round-off grows along the run.
+        eps (float): Machine epsilon of the storage type.
+        tolerance (float or None): Acceptable absolute error, if one was given.
+        safe (bool or None): max_abs_error <= tolerance; None without a tolerance.
+    """
+    __slots__ = ()
+
+    def __str__(self):
+        verdict = "" if self.safe is None else (" - safe" if self.safe else " - NOT safe")
+        limit = "" if self.tolerance is None else f" (tolerance {self.tolerance:.3g})"
+        return (f"{self.dtype} vs float64: max abs error {self.max_abs_error:.3e}, "
+                f"max rel error {self.max_rel_error:.3e}, final level {self.level_errors[-1]:.3e}, "
+                f"eps {self.eps:.3e}{limit}{verdict}")
+
+def precision_report(u, u_reference, dtype, tolerance=None):
+    """
+    Compare a reduced-precision history with the float64 history of the same run.
+
+    The difference is formed in float64 over blocks of rows, so no full float64 copy
+    of the reduced history is made.
+
+    Parameters:
+        u (np.ndarray): Reduced-precision solution, shape (n_levels, ...).
+        u_reference (np.ndarray): float64 solution of the same shape.
+        dtype (str): Precision option used for u.
+        tolerance (float or None): Absolute error considered acceptable.
+
+    Returns:
+        PrecisionReport: Error summary.
+    """
+    u = np.asarray(u)
+    u_reference = np.asarray(u_reference)
+    if u.shape != u_reference.shape:
+        raise ValueError(f"Shapes differ: {u.shape} and {u_reference.shape}")
+
+    n_levels = u.shape[0]
+    rows = max(1, CHUNK_BYTES // max(1, u_reference[0].nbytes))
+    level_errors = np.empty(n_levels)
+    for start in range(0, n_levels, rows):
+        block = np.abs(u[start:start + rows].astype(np.float64) - u_reference[start:start + rows])
+        level_errors[start:start + rows] = block.reshape(block.shape[0], -1).max(axis=1)
+
+    max_abs = float(level_errors.max())
+    scale = float(np.max(np.abs(u_reference)))
+    return PrecisionReport(str(dtype), max_abs, max_abs / scale if scale > 0 else max_abs, level_errors,
+                           float(np.finfo(u.dtype).eps), tolerance,
+                           None if tolerance is None else max_abs <= tolerance)
+
+def compare_precision(solve, *args, dtype='float32', tolerance=None, field=2, **kwargs):
+    """
+    Run a solver in reduced precision and in float64 and report the difference.
+
+    Parameters:
+        solve (callable): Solver accepting a dtype keyword and returning a tuple,
+            such as the (x, t, u, ...) solvers of computation-methods and solution-bounds.
+        *args, **kwargs: Passed to solve in both runs.
+        dtype (str): Reduced precision option, 'float32' or 'mixed'.
+        tolerance (float or None): Absolute error considered acceptable.
+        field (int): Position of the solution history in the returned tuple.
+
+    Returns:
+        result (tuple): Return value of the reduced-precision run.
+        report (PrecisionReport): Its error against the float64 run.
+    """
+    result = solve(*args, dtype=dtype, **kwargs)
+    reference = solve(*args, dtype='float64', **kwargs)
+    return result, precision_report(result[field], reference[field], dtype, tolerance)
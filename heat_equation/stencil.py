@@ -0,0 +1,147 @@
+import numpy as np
+
+from .jit import ftcs_march_kernel, ftcs_step_kernel, resolve_backend
+
+def ftcs_step(u, u_new, r):
+    """
+    Advance the interior of u by one FTCS step, writing the result into u_new.
+
+    The boundary entries u_new[..., 0] and u_new[..., -1] are left untouched, so
+    Dirichlet values written once into both buffers stay fixed for the whole run.
+    The stencil acts on the last axis, so a (K, N) array advances K problems at once.
+
+    Parameters:
+        u (np.ndarray): Solution at time level n.
+        u_new (np.ndarray): Preallocated buffer for time level n + 1 (same shape as u).
+        r (float or np.ndarray): Mesh ratio alpha * dt / dx**2; shape (K, 1) for one
+            ratio per batched problem.
+
+    Returns:
+        np.ndarray: u_new.
+    """
+    interior = u_new[..., 1:-1]
+    np.add(u[..., :-2], u[..., 2:], out=interior)
+    interior *= r
+    interior += (1 - 2 * r) * u[..., 1:-1]
+    return u_new
+
+def ftcs_march(u_init, r, n_steps, u_left=0.0, u_right=0.0, history=None, backend='numpy', dtype=float):
+    """
+    March the explicit (FTCS) scheme n_steps steps.
+
+    A single 1D problem with a scalar r takes one np.correlate call per step. Each call
+    returns a new array that is copied into u, or into the next row of history when it
+    has the working dtype; on small grids this is still cheaper than the chain of ufunc
+    calls in ftcs_step. The weighted sum is grouped differently from ftcs_step, so the
+    two paths agree to round-off, not bitwise. Batched problems advance with ftcs_step
+    in two preallocated, swapped buffers.
+
+    Parameters:
+        u_init (np.ndarray): Initial state u(x, 0), boundary entries included.
+        r (float): Mesh ratio alpha * dt / dx**2.
+        n_steps (int): Number of time steps to take.
+        u_left (float): Dirichlet value at x=0.
+        u_right (float): Dirichlet value at x=L.
+        history (np.ndarray or None): Optional array of shape (n_steps + 1, len(u_init));
+            row n + 1 receives the state after step n. Row 0 is not modified.
+        backend (str): 'numpy', 'numba' or 'auto'; see heat_equation.jit. The compiled
+            kernel runs the whole march in one call; its result agrees with the NumPy
+            march to round-off.
+        dtype (np.dtype): Type of the working state; history rows are rounded to the
+            dtype of history when stored (see heat_equation.precision).
+
+    Returns:
+        np.ndarray: Final state after n_steps steps.
+    """
+    u = np.array(u_init, dtype=dtype)
+    u[0] = u_left
+    u[-1] = u_right
+    u_new = u.copy()
+
+    if resolve_backend(backend) == 'numba' and np.ndim(r) == 0 and u.ndim == 1:
+        keep_history = history is not None
+        buffer = history if keep_history else np.empty((0, u.size))
+        return ftcs_march_kernel(u, u_new, float(r), n_steps, buffer, keep_history)
+
+    if np.ndim(r) == 0 and u.ndim == 1:
+        # One correlation per step instead of several ufunc calls; on small grids with
+        # many steps the per-call overhead is most of the cost, not the allocation
+        weights = np.array([r, 1 - 2 * r, r], dtype=u.dtype)
+        if n_steps and history is not None and history.dtype == u.dtype:
+            # March inside history: every row is computed from the row above
+            history[1:n_steps + 1, 0] = u_left
+            history[1:n_steps + 1, -1] = u_right
+            interior = history[:, 1:-1]
+            interior[1] = np.correlate(u, weights, 'valid')
+            for n in range(1, n_steps):
+                interior[n + 1] = np.correlate(history[n], weights, 'valid')
+            return history[n_steps].copy()
+        for n in range(n_steps):
+            u[1:-1] = np.correlate(u, weights, 'valid')
+            if history is not None:
+                history[n + 1] = u
+        return u
+
+    for n in range(n_steps):
+        ftcs_step(u, u_new, r)
+        if history is not None:
+            history[n + 1] = u_new
+        u, u_new = u_new, u
+
+    return u
+
+def ftcs_stepper(r, backend='numpy'):
+    """
+    Build a step(u, u_new) callable for the explicit (FTCS) scheme.
+
+    Parameters:
+        r (float or np.ndarray): Mesh ratio alpha * dt / dx**2; shape (K, 1) for one
+            ratio per batched problem.
+        backend (str): 'numpy', 'numba' or 'auto'; the compiled kernel handles a single
+            1D problem with a scalar r, batched problems always use NumPy.
+
+    Returns:
+        callable: step(u, u_new) writing the interior of level n + 1 into u_new.
+    """
+    if resolve_backend(backend) == 'numba' and np.ndim(r) == 0:
+        r = float(r)
+
+        def step(u, u_new):
+            ftcs_step_kernel(u, u_new, r)
+            return u_new
+        return step
+
+    def step(u, u_new):
+        return ftcs_step(u, u_new, r)
+    return step
+
+def rk2_stepper(r, n_points):
+    """
+    Build a step(u, u_new) callable for the RK2 (midpoint) method of lines.
+
+    Parameters:
+        r (float or np.ndarray): Mesh ratio alpha * dt / dx**2; shape (K, 1) for one
+            ratio per batched problem.
+        n_points (int or tuple): Number of spatial points, boundaries included, or the
+            state shape (K, n_points) for K batched problems.
+
+    Returns:
+        callable: step(u, u_new) writing the interior of level n + 1 into u_new.
+    """
+    half = np.empty(n_points)
+    scratch = np.empty_like(half[..., 1:-1])
+
+    def step(u, u_new):
+        # half = u + 0.5 * k1
+        half[..., 0] = u[..., 0]
+        half[..., -1] = u[..., -1]
+        ftcs_step(u, half, 0.5 * r)
+        # u_new = u + k2, with k2 = r * (half[i-1] - 2 half[i] + half[i+1])
+        interior = u_new[..., 1:-1]
+        np.add(half[..., :-2], half[..., 2:], out=interior)
+        np.multiply(half[..., 1:-1], 2, out=scratch)
+        interior -= scratch
+        interior *= r
+        interior += u[..., 1:-1]
+        return u_new
+    return step
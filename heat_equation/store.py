@@ -0,0 +1,146 @@
+import json
+import os
+
+import numpy as np
+
+CHUNK_BYTES = 64 * 2**20
+
+class SolutionStore:
+    """
+    Space-time solution u[n, i] kept on disk as a memory-mapped .npy file.
+
+    A store is a directory holding u.npy (one row per saved time level), x.npy, t.npy
+    and metadata.json (L, T, alpha, grid sizes, method, ... plus the number of rows
+    written so far). Rows are written one at a time as a solver streams, and analyses
+    read the run back chunk by chunk, so neither side needs the whole field in RAM.
+
+    Parameters:
+        path (str): Store directory, as created by SolutionStore.create.
+        mode (str): 'r' to read, 'r+' to keep appending.
+    """
+
+    def __init__(self, path, mode='r'):
+        if mode not in ('r', 'r+'):
+            raise ValueError(f"Unknown mode '{mode}', expected 'r' or 'r+'")
+        self.path = path
+        with open(os.path.join(path, 'metadata.json')) as handle:
+            self.metadata = json.load(handle)
+        self.x = np.load(os.path.join(path, 'x.npy'))
+        self.t = np.load(os.path.join(path, 't.npy'))
+        self.u = np.load(os.path.join(path, 'u.npy'), mmap_mode=mode)
+        self.n_written = self.metadata.pop('n_written')
+
+    @classmethod
+    def create(cls, path, x, t, dtype='float64', **metadata):
+        """
+        Create an empty store for len(t) rows of len(x) values and open it for appending.
+
+        Parameters:
+            path (str): Store directory; created if needed, an existing store is overwritten.
+            x (np.ndarray): Spatial points.
+            t (np.ndarray): Times of the rows that will be written.
+            dtype (str or np.dtype): Storage type of u.
+            **metadata: JSON-serializable run description (L, T, alpha, method, ...).
+
+        Returns:
+            SolutionStore: The store in 'r+' mode.
+        """
+        os.makedirs(path, exist_ok=True)
+        x = np.asarray(x, dtype=float)
+        t = np.asarray(t, dtype=float)
+        np.save(os.path.join(path, 'x.npy'), x)
+        np.save(os.path.join(path, 't.npy'), t)
+        u = np.lib.format.open_memmap(os.path.join(path, 'u.npy'), mode='w+', dtype=dtype,
+                                      shape=(t.size, x.size))
+        del u
+        cls._write_metadata(path, dict(metadata, n_written=0))
+        return cls(path, mode='r+')
+
+    @staticmethod
+    def _write_metadata(path, metadata):
+        tmp_path = os.path.join(path, 'metadata.json.tmp')
+        with open(tmp_path, 'w') as handle:
+            json.dump(metadata, handle, indent=2, default=float)
+        os.replace(tmp_path, os.path.join(path, 'metadata.json'))
+
+    @property
+    def shape(self):
+        return self.u.shape
+
+    def __len__(self):
+        return self.n_written
+
+    def append(self, u):
+        """Write the next time level."""
+        if self.n_written >= self.u.shape[0]:
+            raise IndexError(f"Store is full ({self.u.shape[0]} rows)")
+        self.u[self.n_written] = u
+        self.n_written += 1
+
+    def flush(self):
+        """Flush written rows to disk and record how many there are."""
+        if self.u.mode == 'r+':
+            self.u.flush()
+            self._write_metadata(self.path, dict(self.metadata, n_written=self.n_written))
+
+    def close(self):
+        self.flush()
+        del self.u
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def chunks(self, rows=None):
+        """
+        Iterate over the written rows in blocks, loading one block at a time.
+
+        Parameters:
+            rows (int or None): Rows per block; by default blocks of about 64 MB.
+
+        Yields:
+            t (np.ndarray): Times of the block.
+            u (np.ndarray): In-memory copy of the block, shape (len(t), len(x)).
+        """
+        if rows is None:
+            rows = max(1, CHUNK_BYTES // max(1, self.u.shape[1] * self.u.itemsize))
+        for start in range(0, self.n_written, rows):
+            stop = min(start + rows, self.n_written)
+            yield self.t[start:stop], np.asarray(self.u[start:stop])
+
+def iter_row_chunks(u, rows=None):
+    """
+    Yield (start, block) row blocks of an in-memory array or a SolutionStore.
+
+    Lets an analysis accept either a dense history or a store and process it
+    chunk by chunk; a dense array is yielded as a single block.
+    """
+    if isinstance(u, SolutionStore):
+        start = 0
+        for _, block in u.chunks(rows):
+            yield start, block
+            start += block.shape[0]
+    else:
+        yield 0, np.asarray(u)
+
+def save_stream(path, snapshots, x, t, dtype='float64', **metadata):
+    """
+    Write the (t, u) snapshots of a streaming solver into a new store, row by row.
+
+    Parameters:
+        path (str): Store directory.
+        snapshots (iterable): (t, u) pairs, e.g. from stream_states.
+        x (np.ndarray): Spatial points.
+        t (np.ndarray): Times of the snapshots, fixing the number of rows.
+        dtype (str or np.dtype): Storage type of u.
+        **metadata: Run description stored in metadata.json.
+
+    Returns:
+        SolutionStore: The finished store, opened for reading.
+    """
+    with SolutionStore.create(path, x, t, dtype=dtype, **metadata) as store:
+        for _, u in snapshots:
+            store.append(u)
+    return SolutionStore(path)
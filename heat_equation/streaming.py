@@ -0,0 +1,125 @@
+import numpy as np
+
+class Reducer:
+    """
+    Scalar diagnostic evaluated on every time level while a solver streams.
+
+    Subclasses implement evaluate(u). After the run, times and values hold one
+    entry per time level, so memory is O(T) scalars instead of O(N * T).
+    """
+
+    def __init__(self):
+        self.times = []
+        self.values = []
+
+    def __call__(self, t, u):
+        self.times.append(t)
+        self.values.append(self.evaluate(u))
+
+    def evaluate(self, u):
+        raise NotImplementedError
+
+    def result(self):
+        """
+        Returns:
+            times (np.ndarray): Time of each evaluation.
+            values (np.ndarray): Reduced value at each time.
+        """
+        return np.asarray(self.times), np.asarray(self.values)
+
+class Energy(Reducer):
+    """
+    Energy ||u(., t)||^2 on a uniform grid.
+
+    Parameters:
+        dx (float): Grid spacing.
+        rule (str): 'trapezoid' (as np.trapz) or 'rectangle' (sum(u**2) * dx).
+    """
+
+    def __init__(self, dx, rule='trapezoid'):
+        super().__init__()
+        if rule not in ('trapezoid', 'rectangle'):
+            raise ValueError(f"Unknown quadrature rule '{rule}'")
+        self.dx = dx
+        self.rule = rule
+
+    def evaluate(self, u):
+        total = np.dot(u, u)
+        if self.rule == 'trapezoid':
+            total -= 0.5 * (u[0]**2 + u[-1]**2)
+        return total * self.dx
+
+class Maximum(Reducer):
+    """Maximum of u over the grid."""
+
+    def evaluate(self, u):
+        return np.max(u)
+
+class Minimum(Reducer):
+    """Minimum of u over the grid."""
+
+    def evaluate(self, u):
+        return np.min(u)
+
+class Probe(Reducer):
+    """
+    Values of u at fixed grid indices.
+
+    Parameters:
+        indices (int or sequence of int): Grid indices to sample.
+    """
+
+    def __init__(self, indices):
+        super().__init__()
+        self.indices = np.atleast_1d(indices)
+
+    def evaluate(self, u):
+        return u[self.indices].copy()
+
+def stream_states(step, u_init, dt, n_steps, stride=1, times=None, reducers=()):
+    """
+    March a one-step scheme while holding only two time levels in memory.
+
+    Snapshots are yielded every `stride` steps (the final level is always
+    included), or only at the levels nearest to the requested `times`. Reducers
+    are evaluated on every level, whether or not it is yielded. A reducer with a true
+    `stop` attribute (see heat_equation.monitors) ends the march after that level,
+    which is then yielded as well.
+
+    Parameters:
+        step (callable): step(u, u_new) writing the interior of level n + 1 into u_new.
+        u_init (np.ndarray): Initial state, boundary entries included.
+        dt (float): Time step.
+        n_steps (int): Number of time steps.
+        stride (int): Yield every stride-th level when times is None.
+        times (sequence of float or None): Output times; overrides stride.
+        reducers (sequence of Reducer): Diagnostics evaluated on every level.
+
+    Yields:
+        t (float): Time of the snapshot.
+        u (np.ndarray): Copy of the state at time t.
+    """
+    if times is None:
+        if stride < 1:
+            raise ValueError(f"stride must be a positive integer, got {stride}")
+        wanted = set(range(0, n_steps + 1, stride))
+        wanted.add(n_steps)
+    else:
+        levels = np.rint(np.asarray(times, dtype=float) / dt).astype(int)
+        wanted = set(np.clip(levels, 0, n_steps).tolist())
+
+    u = np.array(u_init, dtype=float)
+    u_new = u.copy()
+
+    for n in range(n_steps + 1):
+        if n > 0:
+            step(u, u_new)
+            u, u_new = u_new, u
+        t = n * dt
+        for reducer in reducers:
+            reducer(t, u)
+        stop = any(getattr(reducer, 'stop', False) for reducer in reducers)
+        if n in wanted or stop:
+            yield t, u.copy()
+        if stop:
+            return
@@ -0,0 +1,246 @@
+import warnings
+
+import numpy as np
+
+from .banded import TridiagonalSolver
+from .boundary import as_boundary_condition
+from .precision import resolve_storage_precision
+
+MEANS = ('harmonic', 'arithmetic')
+NONLINEAR_SCHEMES = ('lagged', 'picard')
+
+def face_diffusivity(alpha, mean='harmonic', out=None):
+    """
+    Diffusivity on the faces x_(i+1/2) between neighbouring nodes, all faces at once.
+
+    The harmonic mean is the series conductance of the two half cells, which keeps the
+    flux continuous across a material interface of a composite rod; the arithmetic
+    mean suits a smoothly varying alpha.
+
+    Parameters:
+        alpha (np.ndarray): Nodal diffusivity, shape (n,).
+        mean (str): 'harmonic' or 'arithmetic'.
+        out (np.ndarray or None): Optional buffer of shape (n - 1,).
+
+    Returns:
+        np.ndarray: Face diffusivity, shape (n - 1,).
+    """
+    if mean not in MEANS:
+        raise ValueError(f"Unknown mean '{mean}', expected one of {MEANS}")
+    alpha = np.asarray(alpha, dtype=float)
+    if out is None:
+        out = np.empty(alpha.size - 1)
+    if mean == 'harmonic':
+        np.multiply(alpha[:-1], alpha[1:], out=out)
+        out *= 2
+        out /= alpha[:-1] + alpha[1:]
+    else:
+        np.add(alpha[:-1], alpha[1:], out=out)
+        out *= 0.5
+    return out
+
+def _nodal_diffusivity(alpha, n_points):
+    """alpha as nodal values (scalar or array), or None when it is a function of u."""
+    if callable(alpha):
+        return None
+    alpha = np.asarray(alpha, dtype=float)
+    if alpha.ndim == 0:
+        return np.full(n_points, float(alpha))
+    if alpha.shape != (n_points,):
+        raise ValueError(f"alpha must have one value per grid point ({n_points}), got shape {alpha.shape}")
+    return alpha
+
+def _diffusion(u, lam, flux, out):
+    """out = lam_(i+1/2) (u_(i+1) - u_i) - lam_(i-1/2) (u_i - u_(i-1)) on the interior (flux form)."""
+    np.subtract(u[1:], u[:-1], out=flux)
+    np.multiply(flux, lam, out=flux)
+    np.subtract(flux[1:], flux[:-1], out=out)
+    return out
+
+def variable_ftcs_stepper(alpha, dt, dx, n_points, mean='harmonic'):
+    """
+    Build a step(u, u_new) callable for the explicit scheme with variable diffusivity.
+
+    u_new[i] = u[i] + dt / dx**2 (a_(i+1/2) (u[i+1] - u[i]) - a_(i-1/2) (u[i] - u[i-1])),
+    with the face values a from face_diffusivity. For alpha(x) they are computed once;
+    for alpha(u) they are recomputed from u every step in a few vector operations,
+    and the stability limit dt / dx**2 (a_(i-1/2) + a_(i+1/2)) <= 1 is checked each time.
+
+    Parameters:
+        alpha (float, np.ndarray or callable): Constant, nodal values alpha(x), or a
+            vectorized function alpha(u).
+        dt (float): Time step.
+        dx (float): Grid spacing.
+        n_points (int): Number of grid points.
+        mean (str): Face average, 'harmonic' or 'arithmetic'.
+
+    Returns:
+        callable: step(u, u_new) writing the interior of u_new; boundary values of the
+            new level are read from u_new.
+    """
+    scale = dt / dx**2
+    nodal = _nodal_diffusivity(alpha, n_points)
+    lam = np.empty(n_points - 1)
+    flux = np.empty(n_points - 1)
+
+    def update_faces(alpha_nodes):
+        face_diffusivity(alpha_nodes, mean, out=lam)
+        np.multiply(lam, scale, out=lam)
+        limit = np.max(lam[:-1] + lam[1:])
+        if limit > 1:
+            raise ValueError(f"Stability condition not met: dt / dx**2 * (a_(i-1/2) + a_(i+1/2)) = {limit} > 1")
+
+    if nodal is not None:
+        update_faces(nodal)
+
+    def step(u, u_new):
+        if nodal is None:
+            update_faces(alpha(u))
+        _diffusion(u, lam, flux, u_new[1:-1])
+        u_new[1:-1] += u[1:-1]
+
+    return step
+
+def variable_crank_nicolson_stepper(alpha, dt, dx, n_points, mean='harmonic', nonlinear='lagged',
+                                    tol=1e-10, max_iter=20):
+    """
+    Build a step(u, u_new) callable for Crank-Nicolson with variable diffusivity.
+
+    The face-averaged operator is symmetric tridiagonal. For alpha(x) it is factorized
+    once. For alpha(u) one TridiagonalSolver is refreshed in place (refactor) with the
+    diffusivity of the current state:
+
+        'lagged': alpha(u^n), one factorization and solve per step (linearly implicit).
+        'picard': start from the lagged solution and iterate with alpha((u^n + u^(n+1)) / 2)
+            until the update is below tol, at most max_iter times.
+
+    Parameters:
+        alpha (float, np.ndarray or callable): Constant, nodal values alpha(x), or a
+            vectorized function alpha(u).
+        dt (float): Time step.
+        dx (float): Grid spacing.
+        n_points (int): Number of grid points.
+        mean (str): Face average, 'harmonic' or 'arithmetic'.
+        nonlinear (str): 'lagged' or 'picard'; ignored unless alpha is callable.
+        tol (float): Picard tolerance on max |change| of u^(n+1).
+        max_iter (int): Maximum number of Picard iterations per step.
+
+    Returns:
+        callable: step(u, u_new) writing the interior of u_new; boundary values of the
+            new level are read from u_new.
+    """
+    if nonlinear not in NONLINEAR_SCHEMES:
+        raise ValueError(f"Unknown nonlinear scheme '{nonlinear}', expected one of {NONLINEAR_SCHEMES}")
+    scale = dt / dx**2
+    nodal = _nodal_diffusivity(alpha, n_points)
+    m = n_points - 2
+
+    lam = np.empty(n_points - 1)
+    flux = np.empty(n_points - 1)
+    off = np.empty(m - 1)
+    diag = np.empty(m)
+    rhs = np.empty(m)
+    mid = np.empty(n_points)
+    solver = TridiagonalSolver(0.0, 1.0, 0.0, n=m)
+
+    def refresh(alpha_nodes):
+        # A = I - 1/2 D(lam), with D the symmetric flux-form operator
+        face_diffusivity(alpha_nodes, mean, out=lam)
+        np.multiply(lam, scale, out=lam)
+        np.multiply(lam[1:-1], -0.5, out=off)
+        np.add(lam[:-1], lam[1:], out=diag)
+        np.multiply(diag, 0.5, out=diag)
+        np.add(diag, 1.0, out=diag)
+        solver.refactor(off, diag, off)
+
+    def solve(u, u_new):
+        # B u^n plus the new boundary values moved to the right-hand side
+        _diffusion(u, lam, flux, rhs)
+        np.multiply(rhs, 0.5, out=rhs)
+        np.add(rhs, u[1:-1], out=rhs)
+        rhs[0] += 0.5 * lam[0] * u_new[0]
+        rhs[-1] += 0.5 * lam[-1] * u_new[-1]
+        u_new[1:-1] = solver.solve(rhs)
+
+    if nodal is not None:
+        refresh(nodal)
+
+    def step(u, u_new):
+        if nodal is not None:
+            solve(u, u_new)
+            return
+        refresh(alpha(u))
+        solve(u, u_new)
+        if nonlinear == 'lagged':
+            return
+        for _ in range(max_iter):
+            np.add(u, u_new, out=mid)
+            np.multiply(mid, 0.5, out=mid)
+            previous = u_new[1:-1].copy()
+            refresh(alpha(mid))
+            solve(u, u_new)
+            if np.max(np.abs(u_new[1:-1] - previous)) <= tol:
+                return
+        warnings.warn(f"Picard iteration did not reach tol = {tol} in {max_iter} iterations",
+                      RuntimeWarning, stacklevel=2)
+
+    return step
+
+def solve_variable_diffusivity(L, T, alpha, x_points, t_points, u0, u_left, u_right, method='crank_nicolson',
+                               mean='harmonic', nonlinear='lagged', tol=1e-10, max_iter=20, dtype='float64'):
+    """
+    Solve u_t = (alpha u_x)_x for alpha(x) given at the nodes or a temperature-dependent alpha(u).
+
+    Parameters:
+        L (float): Length of the rod.
+        T (float): Total time.
+        alpha (float, np.ndarray or callable): Constant, nodal values of shape (x_points,),
+            or a vectorized function alpha(u).
+        x_points (int): Number of spatial points.
+        t_points (int): Number of time points.
+        u0 (callable): Initial condition u(x, 0).
+        u_left, u_right (float or callable): Dirichlet values, constant or functions of t
+            (sampled once over all time levels).
+        method (str): 'explicit' or 'crank_nicolson'.
+        mean, nonlinear, tol, max_iter: See variable_crank_nicolson_stepper.
+        dtype (str): 'float64', or 'mixed' to step in float64 and store every level in
+            float32 as it is produced; see heat_equation.precision.
+
+    Returns:
+        x, t, u: Spatial points, time points and the solution of shape (t_points, x_points).
+    """
+    storage_dtype = resolve_storage_precision(dtype, "solve_variable_diffusivity")
+    dx = L / (x_points - 1)
+    dt = T / (t_points - 1)
+    x = np.linspace(0, L, x_points)
+    t = np.linspace(0, T, t_points)
+
+    if method == 'explicit':
+        step = variable_ftcs_stepper(alpha, dt, dx, x_points, mean)
+    elif method == 'crank_nicolson':
+        step = variable_crank_nicolson_stepper(alpha, dt, dx, x_points, mean, nonlinear, tol, max_iter)
+    else:
+        raise ValueError(f"Unknown method '{method}', expected 'explicit' or 'crank_nicolson'")
+
+    left = as_boundary_condition(u_left)
+    right = as_boundary_condition(u_right)
+    if not (left.is_dirichlet and right.is_dirichlet):
+        raise ValueError("Variable diffusivity supports Dirichlet ends only")
+
+    # Two float64 levels are stepped; each new level is stored in the history as it is produced
+    left_values = left.dirichlet_values(t)
+    right_values = right.dirichlet_values(t)
+    u = np.empty((t_points, x_points), dtype=storage_dtype)
+    state = np.empty(x_points)
+    state_new = np.empty(x_points)
+    state[:] = u0(x)
+    state[0], state[-1] = left_values[0], right_values[0]
+    u[0] = state
+
+    for n in range(t_points - 1):
+        state_new[0], state_new[-1] = left_values[n + 1], right_values[n + 1]
+        step(state, state_new)
+        u[n + 1] = state_new
+        state, state_new = state_new, state
+
+    return x, t, u
@@ -0,0 +1,109 @@
+import time
+
+import numpy as np
+import sympy as sp
+
+from .disk_cache import cached_simplify
+from .parallel import run_tasks
+
+def _heat_terms(u_expr, x, t, alpha):
+    """u_t and alpha * u_xx of a candidate solution."""
+    return sp.diff(u_expr, t), alpha * sp.diff(u_expr, x, 2)
+
+def numeric_screen(u_expr, x, t, alpha, n_samples=32, x_range=(0.0, 1.0), t_range=(0.0, 1.0),
+                   rtol=1e-8, rng=None):
+    """
+    Cheap check of u_t - alpha * u_xx = 0 at random sample points.
+
+    The residual is lambdified and evaluated at n_samples random (x, t) points. Free
+    symbols other than x and t (e.g. a symbolic alpha) receive random values in
+    [0.1, 2]. A point fails when |u_t - alpha u_xx| > rtol * (|u_t| + |alpha u_xx| + 1).
+
+    Parameters:
+        u_expr (sympy expression): Candidate solution u(x, t).
+        x, t (sympy.Symbol): Spatial and time variables.
+        alpha (float or sympy expression): Thermal diffusivity.
+        n_samples (int): Number of sample points.
+        x_range, t_range (tuple): Sampling intervals.
+        rtol (float): Relative tolerance.
+        rng (np.random.Generator or None): Random generator.
+
+    Returns:
+        passed (bool): False if any finite sample violates the tolerance.
+        max_residual (float): Largest scaled residual among finite samples.
+    """
+    rng = np.random.default_rng(rng)
+    u_t, alpha_u_xx = _heat_terms(u_expr, x, t, alpha)
+    parameters = sorted((u_t.free_symbols | alpha_u_xx.free_symbols) - {x, t}, key=str)
+    evaluate = sp.lambdify([x, t] + parameters, [u_t, alpha_u_xx], 'numpy')
+
+    x_vals = rng.uniform(*x_range, size=n_samples)
+    t_vals = rng.uniform(*t_range, size=n_samples)
+    parameter_vals = [rng.uniform(0.1, 2.0, size=n_samples) for _ in parameters]
+
+    with np.errstate(all='ignore'):
+        lhs, rhs = (np.broadcast_to(np.asarray(value, dtype=complex), x_vals.shape)
+                    for value in evaluate(x_vals, t_vals, *parameter_vals))
+        scaled = np.abs(lhs - rhs) / (np.abs(lhs) + np.abs(rhs) + 1)
+
+    finite = np.isfinite(scaled)
+    if not finite.any():
+        return True, np.nan  # nothing to judge numerically; leave it to simplification
+    max_residual = float(np.max(scaled[finite]))
+    return max_residual <= rtol, max_residual
+
+def _symbolic_task(args):
+    u_expr, x, t, alpha, cache = args
+    start = time.perf_counter()
+    u_t, alpha_u_xx = _heat_terms(u_expr, x, t, alpha)
+    residual = cached_simplify(u_t - alpha_u_xx, cache=cache)
+    return residual, time.perf_counter() - start
+
+def verify_candidates(candidates, x, t, alpha, n_samples=32, rtol=1e-8, x_range=(0.0, 1.0),
+                      t_range=(0.0, 1.0), seed=None, n_workers=None, cache=None):
+    """
+    Check many candidate solutions of u_t = alpha * u_xx at once.
+
+    Every candidate first goes through numeric_screen; only the survivors are
+    simplified symbolically, on a process pool.
+
+    Parameters:
+        candidates (sequence of sympy expressions): Candidate solutions u(x, t).
+        x, t (sympy.Symbol): Spatial and time variables.
+        alpha (float or sympy expression): Thermal diffusivity.
+        n_samples, rtol, x_range, t_range: Passed to numeric_screen.
+        seed (int or None): Seed for the sample points.
+        n_workers (int or None): Worker processes for simplification; None uses all cores.
+        cache (SymbolicDiskCache, bool or None): Disk cache for the simplification.
+
+    Returns:
+        list of dict: One report per candidate, in input order, with keys
+            'candidate', 'is_solution', 'stage' ('numeric' if rejected by the screen,
+            'symbolic' otherwise), 'numeric_residual', 'residual' (simplified sympy
+            residual or None), 'numeric_seconds' and 'symbolic_seconds'.
+    """
+    rng = np.random.default_rng(seed)
+    reports = []
+    survivors = []
+    for u_expr in candidates:
+        start = time.perf_counter()
+        passed, max_residual = numeric_screen(u_expr, x, t, alpha, n_samples=n_samples, x_range=x_range,
+                                              t_range=t_range, rtol=rtol, rng=rng)
+        reports.append({
+            'candidate': u_expr,
+            'is_solution': False,
+            'stage': 'numeric',
+            'numeric_residual': max_residual,
+            'residual': None,
+            'numeric_seconds': time.perf_counter() - start,
+            'symbolic_seconds': None,
+        })
+        if passed:
+            survivors.append(len(reports) - 1)
+
+    arguments = [(reports[i]['candidate'], x, t, alpha, cache) for i in survivors]
+    for i, (residual, seconds) in zip(survivors, run_tasks(_symbolic_task, arguments, n_workers)):
+        reports[i].update(stage='symbolic', residual=residual, is_solution=residual == 0,
+                          symbolic_seconds=seconds)
+
+    return reports
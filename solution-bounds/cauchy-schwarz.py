@@ -1,8 +1,16 @@
+import os
+import sys
+
 import numpy as np
 import matplotlib.pyplot as plt
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from heat_equation import CauchySchwarzMonitor, ftcs_march, ftcs_stepper, resolve_precision, stream_states
+
 def solve_heat_equation_with_cauchy_schwarz(L=1.0, alpha=0.01, x_points=100, t_points=100, T=1.0, 
-                                            u0=lambda x: np.sin(np.pi * x), u_left=0, u_right=0):
+                                            u0=lambda x: np.sin(np.pi * x), u_left=0, u_right=0, keep_history=True,
+                                            backend='numpy', stop_on_violation=True, dtype='float64'):
     """
     Solve the 1D heat equation and compute bounds using the Cauchy-Schwarz inequality.
 
@@ -15,11 +23,20 @@ def solve_heat_equation_with_cauchy_schwarz(L=1.0, alpha=0.01, x_points=100, t_p
         u0 (function): Initial condition function f(x) defined on [0, L].
         u_left (float): Boundary condition at x=0.
         u_right (float): Boundary condition at x=L.
+        keep_history (bool): Store the full solution array. If False, only two time
+            levels are held in memory, the energy is computed on the fly and u is None,
+            and the decay of ||u|| (zero boundary values only) is checked on every step.
+        backend (str): 'numpy', 'numba' or 'auto' for the FTCS kernel; see heat_equation.jit.
+        stop_on_violation (bool): Without history, stop at the first violated bound;
+            the returned arrays then end at the violating level.
+        dtype (str): Precision of the stored history: 'float64', 'float32', or 'mixed' to
+            step in float64 and store float32; see heat_equation.precision. Without
+            history the run steps in float64 and only 'float64' is accepted.
 
     Returns:
         x (np.ndarray): Spatial points.
         t (np.ndarray): Time points.
-        u (np.ndarray): Solution array u(x, t).
+        u (np.ndarray or None): Solution array u(x, t).
         energy (np.ndarray): Energy ||u(x, t)||^2 over time.
         bounds (np.ndarray): Array of bounds derived using Cauchy-Schwarz.
     """
@@ -34,23 +51,42 @@ def solve_heat_equation_with_cauchy_schwarz(L=1.0, alpha=0.01, x_points=100, t_p
     if r > 0.5:
         raise ValueError(f"Stability condition not met: r = {r} > 0.5")
 
+    compute_dtype, storage_dtype = resolve_precision(dtype)
+    if not keep_history:
+        if storage_dtype != np.float64:
+            raise ValueError(f"dtype '{dtype}' sets the precision of the stored history; "
+                             "keep_history=False steps in float64")
+        u_init = np.empty(x_points)
+        u_init[:] = u0(x)
+        u_init[0] = u_left
+        u_init[-1] = u_right
+
+        monitor = CauchySchwarzMonitor(dx, monotone=(u_left == 0 and u_right == 0),
+                                       stop_on_violation=stop_on_violation)
+        for _ in stream_states(ftcs_stepper(r, backend), u_init, dt, t_points - 1, times=(), reducers=[monitor]):
+            pass
+        if monitor.violation is not None:
+            print(monitor.violation)
+        times, bounds = monitor.result()
+        return x, t[:len(times)], None, bounds**2, bounds
+
     # Initialize the solution matrix
-    u = np.zeros((t_points, x_points))
+    u = np.zeros((t_points, x_points), dtype=storage_dtype)
 
     # Set the initial condition
-    u[0, :] = u0(x)
+    u_init = np.empty(x_points, dtype=compute_dtype)
+    u_init[:] = u0(x)
+    u[0, :] = u_init
 
     # Set boundary conditions
     u[:, 0] = u_left
     u[:, -1] = u_right
 
     # Time-stepping to solve the heat equation
-    for n in range(0, t_points - 1):
-        for i in range(1, x_points - 1):
-            u[n + 1, i] = u[n, i] + r * (u[n, i - 1] - 2 * u[n, i] + u[n, i + 1])
+    ftcs_march(u_init, r, t_points - 1, u_left, u_right, history=u, backend=backend, dtype=compute_dtype)
 
-    # Compute energy and bounds using Cauchy-Schwarz
-    energy = np.array([np.sum(u[n, :]**2) * dx for n in range(t_points)])  # Energy ||u(x, t)||^2
+    # Compute energy and bounds using Cauchy-Schwarz, summed in float64
+    energy = np.sum(u**2, axis=1, dtype=float) * dx  # Energy ||u(x, t)||^2 of all rows at once
     bounds = np.sqrt(energy)  # Cauchy-Schwarz: ||u v|| ≤ ||u|| ||v||
 
     return x, t, u, energy, bounds
@@ -72,7 +108,8 @@ u_right_boundary = 0  # Boundary condition at x=L
 x, t, u, energy, bounds = solve_heat_equation_with_cauchy_schwarz(L, alpha, x_points, t_points, T,
                                                                   u0=initial_condition,
                                                                   u_left=u_left_boundary,
-                                                                  u_right=u_right_boundary)
+                                                                  u_right=u_right_boundary,
+                                                                  keep_history=False)
 
 # Plot the superposed graph
 plt.figure(figsize=(10, 6))
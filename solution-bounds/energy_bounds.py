@@ -1,7 +1,33 @@
+import os
+import sys
+
 import numpy as np
 import matplotlib.pyplot as plt
+from scipy.integrate import trapezoid
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from heat_equation import (EnergyMonitor, ftcs_march, iter_row_chunks, ftcs_stepper, resolve_precision,
+                           spectral_exact_solution, spectral_stepper, stream_states)
 
-def solve_heat_equation_energy_bounds(L, alpha, x_points, t_points, T, u0, u_left, u_right):
+def energy_from_solution(u, x):
+    """
+    Energy ||u(x, t)||^2 (trapezoid rule) of every stored time level, accumulated in
+    float64 whatever the storage type of u.
+
+    Parameters:
+        u (np.ndarray or SolutionStore): Solution of shape (t_points, x_points); a store
+            is read lazily, one chunk of rows at a time.
+        x (np.ndarray): Spatial points.
+
+    Returns:
+        np.ndarray: Energy at each time level.
+    """
+    return np.concatenate([trapezoid(np.asarray(block, dtype=float)**2, x, axis=1)
+                           for _, block in iter_row_chunks(u)])
+
+def solve_heat_equation_energy_bounds(L, alpha, x_points, t_points, T, u0, u_left, u_right, keep_history=True,
+                                     method='ftcs', backend='numpy', stop_on_violation=True, dtype='float64'):
     """
     Solve the 1D heat equation and calculate energy-based bounds using the energy method.
 
@@ -14,6 +40,18 @@ def solve_heat_equation_energy_bounds(L, alpha, x_points, t_points, T, u0, u_lef
         u0 (callable): Initial condition function, u(x, 0).
         u_left (float): Boundary condition at x=0.
         u_right (float): Boundary condition at x=L.
+        keep_history (bool): Store the full solution matrix. If False, only two time
+            levels are held in memory, the energy is computed on the fly and u is None.
+            With zero boundary values the energy is then also checked to decay on
+            every step, and the first violation is reported.
+        method (str): 'ftcs' marches the explicit scheme; 'spectral' advances the same
+            spatial discretisation exactly in time (DST-I), with no stability limit.
+        stop_on_violation (bool): Without history, stop at the first energy increase;
+            t and energy then end at the violating level.
+        backend (str): 'numpy', 'numba' or 'auto' for the FTCS kernel; see heat_equation.jit.
+        dtype (str): Precision of the stored history: 'float64', 'float32', or 'mixed' to
+            step in float64 and store float32; see heat_equation.precision. Without
+            history the run steps in float64 and only 'float64' is accepted.
 
     Returns:
         x, t, u, energy: Spatial points, time points, solution matrix, and energy at each time step.
@@ -22,26 +60,58 @@ def solve_heat_equation_energy_bounds(L, alpha, x_points, t_points, T, u0, u_lef
     dt = T / (t_points - 1)
     r = alpha * dt / dx**2
 
-    if r > 0.5:
-        raise ValueError(f"Stability condition not met: r = {r} > 0.5")
+    if method == 'ftcs':
+        if r > 0.5:
+            raise ValueError(f"Stability condition not met: r = {r} > 0.5")
+        step = ftcs_stepper(r, backend)
+    elif method == 'spectral':
+        step = spectral_stepper(alpha, dt, dx, x_points)
+    else:
+        raise ValueError(f"Unknown method '{method}', expected 'ftcs' or 'spectral'")
 
     # Discretize space and time
     x = np.linspace(0, L, x_points)
     t = np.linspace(0, T, t_points)
-    u = np.zeros((t_points, x_points))
+
+    compute_dtype, storage_dtype = resolve_precision(dtype)
+    if not keep_history:
+        if storage_dtype != np.float64:
+            raise ValueError(f"dtype '{dtype}' sets the precision of the stored history; "
+                             "keep_history=False steps in float64")
+        u_init = np.empty(x_points)
+        u_init[:] = u0(x)
+        u_init[0] = u_left
+        u_init[-1] = u_right
+
+        energy = EnergyMonitor(dx, rule='trapezoid', monotone=(u_left == 0 and u_right == 0),
+                               stop_on_violation=stop_on_violation)
+        for _ in stream_states(step, u_init, dt, t_points - 1, times=(), reducers=[energy]):
+            pass
+        if energy.violation is not None:
+            print(energy.violation)
+        times, values = energy.result()
+        return x, t[:len(times)], None, values
+
+    u = np.zeros((t_points, x_points), dtype=storage_dtype)
 
     # Initial and boundary conditions
-    u[0, :] = u0(x)
+    u_init = np.empty(x_points, dtype=compute_dtype)
+    u_init[:] = u0(x)
+    u_init[0] = u_left
+    u_init[-1] = u_right
+    u[0, :] = u_init
     u[:, 0] = u_left
     u[:, -1] = u_right
 
-    # Time stepping (FTCS scheme)
-    for n in range(0, t_points - 1):
-        for i in range(1, x_points - 1):
-            u[n + 1, i] = u[n, i] + r * (u[n, i - 1] - 2 * u[n, i] + u[n, i + 1])
+    if method == 'spectral':
+        # Every time level is reached directly, no marching
+        spectral_exact_solution(u_init, alpha, dx, t, out=u)
+    else:
+        # Time stepping (FTCS scheme)
+        ftcs_march(u_init, r, t_points - 1, u_left, u_right, history=u, backend=backend, dtype=compute_dtype)
 
-    # Calculate energy
-    energy = np.array([np.trapz(u[n, :]**2, x) for n in range(t_points)])
+    # Calculate energy of all rows at once
+    energy = energy_from_solution(u, x)
 
     return x, t, u, energy
 
@@ -60,7 +130,8 @@ u_right_boundary = 0.0  # Boundary condition at x=L
 x, t, u, energy = solve_heat_equation_energy_bounds(L, alpha, x_points, t_points, T,
                                                     u0=initial_condition,
                                                     u_left=u_left_boundary,
-                                                    u_right=u_right_boundary)
+                                                    u_right=u_right_boundary,
+                                                    keep_history=False)
 
 fig, ax = plt.subplots(figsize=(10, 6))
 
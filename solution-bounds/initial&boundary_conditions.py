@@ -1,11 +1,28 @@
+import os
+import sys
+
 import numpy as np
 import matplotlib.pyplot as plt
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from heat_equation import MaximumPrincipleMonitor, ftcs_march, ftcs_stepper, resolve_precision, stream_states
+
 def solve_heat_equation_with_bounds(L=1.0, alpha=0.01, x_points=100, t_points=100, T=1.0, 
-                                    u0=lambda x: np.sin(np.pi * x), u_left=0, u_right=0):
+                                    u0=lambda x: np.sin(np.pi * x), u_left=0, u_right=0, keep_history=True,
+                                    backend='numpy', stop_on_violation=True, dtype='float64'):
     """
     Solve the 1D heat equation and compute bounds based on initial and boundary conditions.
     Adjusts time step to meet stability condition if needed.
+
+    Returns x, t, u, (lower_bound, upper_bound) and the observed range of every time
+    level as an array of (min, max) rows. With keep_history=False only two time levels
+    are held in memory, u is None and the ranges come from the monitor. The bounds are
+    then checked on every step, and with stop_on_violation the run ends at the first
+    level leaving them, which is reported. backend selects the FTCS kernel ('numpy',
+    'numba' or 'auto'; see heat_equation.jit). dtype sets the precision of the stored
+    history: 'float64', 'float32', or 'mixed' to step in float64 and store float32;
+    without history the run steps in float64 and only 'float64' is accepted.
     """
     # Discretize space
     x = np.linspace(0, L, x_points)
@@ -20,25 +37,46 @@ def solve_heat_equation_with_bounds(L=1.0, alpha=0.01, x_points=100, t_points=10
     # Compute the actual r value
     r = alpha * dt / dx**2
 
+    compute_dtype, storage_dtype = resolve_precision(dtype)
+    if not keep_history:
+        if storage_dtype != np.float64:
+            raise ValueError(f"dtype '{dtype}' sets the precision of the stored history; "
+                             "keep_history=False steps in float64")
+        u_init = np.empty(x_points)
+        u_init[:] = u0(x)
+        u_init[0] = u_left
+        u_init[-1] = u_right
+
+        upper_bound = max(np.max(u_init), u_left, u_right)
+        lower_bound = min(np.min(u_init), u_left, u_right)
+        monitor = MaximumPrincipleMonitor(lower_bound, upper_bound, stop_on_violation=stop_on_violation)
+        for _ in stream_states(ftcs_stepper(r, backend), u_init, dt, t_points - 1, times=(), reducers=[monitor]):
+            pass
+        if monitor.violation is not None:
+            print(monitor.violation)
+        times, ranges = monitor.result()
+        return x, t[:len(times)], None, (lower_bound, upper_bound), ranges
+
     # Initialize the solution matrix
-    u = np.zeros((t_points, x_points))
+    u = np.zeros((t_points, x_points), dtype=storage_dtype)
 
-    u[0, :] = u0(x)
+    u_init = np.empty(x_points, dtype=compute_dtype)
+    u_init[:] = u0(x)
+    u[0, :] = u_init
 
     # Set boundary conditions
     u[:, 0] = u_left
     u[:, -1] = u_right
 
-    for n in range(0, t_points - 1):
-        for i in range(1, x_points - 1):
-            u[n + 1, i] = u[n, i] + r * (u[n, i - 1] - 2 * u[n, i] + u[n, i + 1])
+    ftcs_march(u_init, r, t_points - 1, u_left, u_right, history=u, backend=backend, dtype=compute_dtype)
 
     max_initial = np.max(u[0, :])
     max_boundary = max(u_left, u_right)
     upper_bound = max(max_initial, max_boundary)
     lower_bound = min(np.min(u[0, :]), min(u_left, u_right))
 
-    return x, t, u, (lower_bound, upper_bound)
+    ranges = np.column_stack((u.min(axis=1), u.max(axis=1)))
+    return x, t, u, (lower_bound, upper_bound), ranges
 
 L = 1.0
 alpha = 0.01
@@ -51,10 +89,10 @@ initial_condition = lambda x: np.sin(np.pi * x)
 u_left_boundary = 0  # Boundary condition at x=0
 u_right_boundary = 0  # Boundary condition at x=L
 
-x, t, u, bounds = solve_heat_equation_with_bounds(L, alpha, x_points, t_points, T,
-                                                  u0=initial_condition,
-                                                  u_left=u_left_boundary,
-                                                  u_right=u_right_boundary)
+x, t, u, bounds, _ = solve_heat_equation_with_bounds(L, alpha, x_points, t_points, T,
+                                                     u0=initial_condition,
+                                                     u_left=u_left_boundary,
+                                                     u_right=u_right_boundary)
 
 plt.figure(figsize=(8, 6))
 for n in range(0, len(t), max(1, len(t) // 5)):
@@ -1,7 +1,16 @@
+import os
+import sys
+
 import numpy as np
 import matplotlib.pyplot as plt
 
-def solve_heat_equation(L=1.0, T=1.0, alpha=0.01, nx=50, nt=100, u0=None, boundary_conditions=(0, 0)):
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from heat_equation import (MaximumPrincipleMonitor, Violation, compare_precision, ftcs_march, ftcs_stepper,
+                           iter_row_chunks, resolve_precision, spectral_exact_solution, stream_states)
+
+def solve_heat_equation(L=1.0, T=1.0, alpha=0.01, nx=50, nt=100, u0=None, boundary_conditions=(0, 0), method='ftcs',
+                       backend='numpy', dtype='float64'):
     """
     Solve the 1D heat equation numerically using the finite difference method.
     
@@ -13,6 +22,12 @@ def solve_heat_equation(L=1.0, T=1.0, alpha=0.01, nx=50, nt=100, u0=None, bounda
         nt (int): Number of time steps.
         u0 (function): Initial condition function f(x). If None, defaults to u(x, 0) = sin(pi * x).
         boundary_conditions (tuple): Dirichlet boundary conditions (u(0, t), u(L, t)).
+        method (str): 'ftcs' marches the explicit scheme; 'spectral' reaches every time
+            level of the same spatial discretisation exactly (DST-I), so long horizons
+            need neither small steps nor the r <= 0.5 restriction.
+        backend (str): 'numpy', 'numba' or 'auto' for the FTCS kernel; see heat_equation.jit.
+        dtype (str): 'float64', 'float32', or 'mixed' to step in float64 and store u in
+            float32; see heat_equation.precision and check_precision below.
     
     Returns:
         x (ndarray): Spatial grid points.
@@ -23,26 +38,34 @@ def solve_heat_equation(L=1.0, T=1.0, alpha=0.01, nx=50, nt=100, u0=None, bounda
     dt = T / (nt - 1)
     r = alpha * dt / dx**2
 
-    if r > 0.5:
+    if method not in ('ftcs', 'spectral'):
+        raise ValueError(f"Unknown method '{method}', expected 'ftcs' or 'spectral'")
+    if method == 'ftcs' and r > 0.5:
         raise ValueError("The solution is unstable. Choose smaller dt or larger dx.")
     
+    compute_dtype, storage_dtype = resolve_precision(dtype)
     x = np.linspace(0, L, nx)
     t = np.linspace(0, T, nt)
-    u = np.zeros((nt, nx))
+    u = np.zeros((nt, nx), dtype=storage_dtype)
 
     # Initial condition
+    u_init = np.empty(nx, dtype=compute_dtype)
     if u0 is None:
-        u[0, :] = np.sin(np.pi * x)
+        u_init[:] = np.sin(np.pi * x)
     else:
-        u[0, :] = u0(x)
+        u_init[:] = u0(x)
+    u_init[0], u_init[-1] = boundary_conditions
+    u[0, :] = u_init
     
     # Boundary conditions
     u[:, 0] = boundary_conditions[0]  # u(0, t)
     u[:, -1] = boundary_conditions[1]  # u(L, t)
     
-    for n in range(0, nt - 1):
-        for i in range(1, nx - 1):
-            u[n + 1, i] = u[n, i] + r * (u[n, i - 1] - 2 * u[n, i] + u[n, i + 1])
+    if method == 'spectral':
+        spectral_exact_solution(u_init, alpha, dx, t, out=u)
+    else:
+        ftcs_march(u_init, r, nt - 1, boundary_conditions[0], boundary_conditions[1], history=u, backend=backend,
+                   dtype=compute_dtype)
     
     return x, t, u
 
@@ -51,25 +74,101 @@ def verify_maximum_principle(u, x, t, u0=None, boundary_conditions=(0, 0)):
     Verify the Maximum Principle for the heat equation solution.
     
     Parameters:
-        u (ndarray): Solution array of shape (nt, nx).
+        u (ndarray or SolutionStore): Solution array of shape (nt, nx), or an on-disk
+            store that is read chunk by chunk.
         x (ndarray): Spatial grid points.
         t (ndarray): Time grid points.
         u0 (function): Initial condition function f(x).
         boundary_conditions (tuple): Boundary conditions (u(0, t), u(L, t)).
+
+    Returns:
+        Violation or None: Where and when the maximum was first exceeded.
     """
-    max_initial = np.max(u[0, :])  # Maximum at t = 0
+    if len(u) == 0:
+        raise ValueError("The solution has no time levels")
     max_boundary = max(boundary_conditions)  # Maximum on spatial boundaries
     
-    max_interior = np.max(u)  # Maximum in the entire domain
-    max_allowed = max(max_initial, max_boundary)
+    # Maximum in the entire domain, one block of rows at a time
+    max_interior = -np.inf
+    violation = None
+    for start, block in iter_row_chunks(u):
+        if start == 0:
+            max_initial = np.max(block[0, :])  # Maximum at t = 0
+            max_allowed = max(max_initial, max_boundary)
+        row_max = np.max(block, axis=1)
+        max_interior = max(max_interior, np.max(row_max))
+        if violation is None:
+            above = np.flatnonzero(row_max > max_allowed)
+            if above.size:
+                row = above[0]
+                violation = Violation('maximum principle (upper)', start + row, t[start + row],
+                                      int(np.argmax(block[row])), row_max[row], max_allowed)
     
     print(f"Maximum in domain: {max_interior}")
     print(f"Maximum on boundaries and initial condition: {max_allowed}")
     
-    if max_interior > max_allowed:
+    if violation is not None:
         print("Maximum Principle violated!")
+        print(violation)
     else:
         print("Maximum Principle satisfied.")
+    return violation
+
+def monitor_maximum_principle(L=1.0, T=1.0, alpha=0.01, nx=50, nt=100, u0=None, boundary_conditions=(0, 0),
+                              stop_on_violation=True, backend='numpy'):
+    """
+    Check the Maximum Principle while solving, without storing the history.
+
+    Every FTCS level is compared in O(nx) against the range of the initial and boundary
+    data as soon as it is produced, and the run stops at the first level that leaves it.
+
+    Returns:
+        Violation or None: Where and when the principle first failed.
+    """
+    dx = L / (nx - 1)
+    dt = T / (nt - 1)
+    r = alpha * dt / dx**2
+
+    if r > 0.5:
+        raise ValueError("The solution is unstable. Choose smaller dt or larger dx.")
+
+    x = np.linspace(0, L, nx)
+    u_init = np.empty(nx)
+    u_init[:] = np.sin(np.pi * x) if u0 is None else u0(x)
+    u_init[0], u_init[-1] = boundary_conditions
+
+    monitor = MaximumPrincipleMonitor(min(np.min(u_init), *boundary_conditions),
+                                      max(np.max(u_init), *boundary_conditions),
+                                      stop_on_violation=stop_on_violation)
+    for _ in stream_states(ftcs_stepper(r, backend), u_init, dt, nt - 1, times=(), reducers=[monitor]):
+        pass
+
+    if monitor.violation is not None:
+        print(monitor.violation)
+    else:
+        print("Maximum Principle satisfied on every time level.")
+    return monitor.violation
+
+def check_precision(L=1.0, T=1.0, alpha=0.01, nx=50, nt=100, u0=None, boundary_conditions=(0, 0), method='ftcs',
+                    dtype='float32'):
+    """
+    Tell whether a reduced-precision solve is accurate enough to check the Maximum Principle.
+
+    The solver runs in dtype and in float64 and the round-off of every level is
+    reported. The reduced run is judged safe when its largest error is below the margin
+    by which the solution stays under the allowed maximum after t = 0, so rounding can
+    neither produce nor hide a violation.
+
+    Returns:
+        PrecisionReport: Error against float64; tolerance is the margin.
+    """
+    (x, t, u), report = compare_precision(solve_heat_equation, L=L, T=T, alpha=alpha, nx=nx, nt=nt, u0=u0,
+                                          boundary_conditions=boundary_conditions, method=method, dtype=dtype)
+    max_allowed = max(np.max(u[0, :]), *boundary_conditions)
+    margin = float(max_allowed - np.max(u[1:, 1:-1]))
+    report = report._replace(tolerance=margin, safe=report.max_abs_error < margin)
+    print(report)
+    return report
 
 # Example: Solve and verify Maximum Principle
 L = 1.0
@@ -83,6 +182,9 @@ x, t, u = solve_heat_equation(L=L, T=T, alpha=alpha, nx=nx, nt=nt, boundary_cond
 
 verify_maximum_principle(u, x, t)
 
+# Would a float32 history have been enough for this check?
+check_precision(L=L, T=T, alpha=alpha, nx=nx, nt=nt, boundary_conditions=(0, 0))
+
 # Plot the solution with Maximum Principle bounds
 plt.figure(figsize=(8, 6))
 for n in range(0, nt, max(1, nt // 5)):
@@ -0,0 +1,27 @@
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from heat_equation import rkc_integrate
+
+def test_rkc_counts_every_rhs_call():
+    nx = 51
+    dx = 1.0 / (nx - 1)
+    alpha = 0.01
+    calls = [0]
+
+    def laplacian(u, out):
+        calls[0] += 1
+        out[0] = out[-1] = 0.0
+        np.add(u[:-2], u[2:], out=out[1:-1])
+        out[1:-1] -= 2 * u[1:-1]
+        out[1:-1] *= alpha / dx**2
+
+    u_init = np.sin(np.pi * np.linspace(0, 1, nx))
+    _, u, stats = rkc_integrate(laplacian, u_init, 100.0, 4 * alpha / dx**2)
+
+    assert stats['n_rhs'] == calls[0]
+    assert np.all(np.isfinite(u))
@@ -2,7 +2,9 @@
 
 import sympy as sp
 
-def is_solution_to_heat_equation(u_expr, x, t, alpha):
+from heat_equation import cached_simplify, verify_candidates
+
+def is_solution_to_heat_equation(u_expr, x, t, alpha, cache=None):
     """
     Test if a given function u(x, t) satisfies the heat equation u_t = alpha * u_xx.
 
@@ -11,6 +13,8 @@ def is_solution_to_heat_equation(u_expr, x, t, alpha):
         x (sympy.Symbol): The spatial variable.
         t (sympy.Symbol): The time variable.
         alpha (float or sympy.Symbol): Thermal diffusivity.
+        cache (SymbolicDiskCache, bool or None): On-disk cache for the simplification;
+            None or True selects the default cache and False disables it.
 
     Returns:
         bool: True if the function satisfies the heat equation, False otherwise.
@@ -24,7 +28,7 @@ def is_solution_to_heat_equation(u_expr, x, t, alpha):
     heat_eq_residual = u_t - alpha * u_xx
 
     # Simplify the residual to check if it is identically zero
-    heat_eq_residual = sp.simplify(heat_eq_residual)
+    heat_eq_residual = cached_simplify(heat_eq_residual, cache=cache)
 
     # Return whether the residual is zero and the residual expression itself
     return heat_eq_residual == 0, heat_eq_residual
@@ -44,3 +48,9 @@ is_solution, residual = is_solution_to_heat_equation(u_candidate, x, t, alpha)
 print(f"Candidate Solution: {u_candidate}")
 print(f"Satisfies Heat Equation: {is_solution}")
 print(f"Residual: {residual}")
+
+# Batch check of a family of separable candidates exp(-alpha * (k pi)^2 * t * c) * sin(k pi x):
+# only c = 1 solves the heat equation, the rest are rejected by the numeric pre-screen
+candidates = [sp.exp(-alpha * (k * sp.pi)**2 * t * c) * sp.sin(k * sp.pi * x) for k in range(1, 4) for c in (1, 2)]
+for report in verify_candidates(candidates, x, t, alpha, seed=0, n_workers=1):
+    print(f"{report['candidate']}: {report['is_solution']} (stage: {report['stage']})")